@@ -1,3 +1,3 @@
-import sys
-import os
+import sys
+import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
\ No newline at end of file
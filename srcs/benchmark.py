@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "True"
+
+import numpy
+
+from srcs import constants
+from srcs.classes.collision_layers import LAYER_NAMES, LAYER_COUNT
+from srcs.classes.controller import BotController
+from srcs.classes.effect import Effect
+from srcs.classes.entity.base_unit import BaseUnit
+from srcs.classes.entity.bullet import Bullet
+from srcs.classes.entity.faction_particle import FactionParticle
+from srcs.classes.entity.game_particle import GameParticle, Particle
+from srcs.classes.entity.lazer import Lazer
+from srcs.classes.entity.missile import Missile
+from srcs.classes.entity.shield import Shield
+from srcs.classes.entity.unit import Unit
+from srcs.classes.water_particle import WaterParticle
+from srcs.classes.weapon_classes.weapons_enum import MainWeaponEnum
+from srcs.main import Game, PROFILED_PHASES
+from srcs.unit_classes.basic_unit import BasicLazerUnit, BasicShootingUnit
+from srcs.unit_classes.spawner_unit import UnitMothership
+from srcs.unit_classes.turret_unit import BulletTurretUnit
+
+IMMORTAL_HP = 1e9
+WATER_PARTICLE_BUDGET = 2000  # ten times the game's, to load the water physics
+
+
+def _make_immortal(unit: Unit):
+    unit.max_hp = unit.hp = IMMORTAL_HP
+
+
+def _bot_aiming_at(x: float, y: float) -> BotController:
+    controller = BotController()
+    controller.aim_x, controller.aim_y = x, y
+    return controller
+
+
+def _max_level(unit: Unit):
+    unit.main_weapon.weapon.level.current_level = unit.main_weapon.weapon.level.max_level
+
+
+def scenario_opening(game: Game):
+    """The default start from init_game: the player against 8 UnitMotherships."""
+
+
+def scenario_fireworks(game: Game):
+    """Max level fireworks (250 Explosive per volley) fired into a pack of shooters."""
+    player = game.data.player
+    player.main_weapon.reinit_weapons(MainWeaponEnum.fireworks)
+    _max_level(player)
+    _make_immortal(player)
+    player.controller = _bot_aiming_at(player.x + 500, player.y)
+    for _ in range(40):
+        angle = game.data.rng.uniform(-math.pi / 4, math.pi / 4)
+        dis = game.data.rng.uniform(300, 900)
+        game.data.enemies.append(BasicShootingUnit(game.enemy_faction, player.x + math.cos(angle) * dis,
+                                                   player.y + math.sin(angle) * dis,
+                                                   color=constants.ENEMY_COLOR))
+
+
+def scenario_lazer_duel(game: Game):
+    """A deleter against a charged lazer, with rows of turrets in the line of fire."""
+    player = game.data.player
+    game.data.enemies[:] = []
+    x, y = constants.MAP_WIDTH / 2, constants.MAP_HEIGHT / 2
+    player.x, player.y = x - 1500, y
+    player.main_weapon.reinit_weapons(MainWeaponEnum.deleter)
+    _make_immortal(player)
+    player.controller = _bot_aiming_at(x + 1500, y)
+
+    rival = Unit(game.enemy_faction, x + 1500, y, weapons=MainWeaponEnum.charged_lazer,
+                 controller=BotController(), color=constants.ENEMY_COLOR)
+    _make_immortal(rival)
+    rival.controller = _bot_aiming_at(x - 1500, y)
+    game.data.enemies.append(rival)
+
+    for i in range(50):
+        game.data.enemies.append(BulletTurretUnit(game.enemy_faction, x + game.data.rng.uniform(-1000, 1000),
+                                                  y + game.data.rng.uniform(-200, 200), color=constants.ENEMY_COLOR))
+        game.data.allies.append(BulletTurretUnit(game.ally_faction, x + game.data.rng.uniform(-1000, 1000),
+                                                 y + game.data.rng.uniform(-200, 200), color=constants.PLAYER_COLOR))
+
+
+def scenario_swarm(game: Game):
+    """250 BasicLazerUnit closing in on the player and an escort, breaking into debris as they die."""
+    player = game.data.player
+    game.data.enemies[:] = []
+    _make_immortal(player)
+    for _ in range(50):
+        angle = game.data.rng.uniform(-math.pi, math.pi)
+        dis = game.data.rng.uniform(50, 300)
+        game.data.allies.append(BasicShootingUnit(game.ally_faction, player.x + math.cos(angle) * dis,
+                                                  player.y + math.sin(angle) * dis,
+                                                  color=constants.PLAYER_COLOR, parent=player))
+    for _ in range(constants.MAX_ENEMY_COUNT):
+        angle = game.data.rng.uniform(-math.pi, math.pi)
+        dis = game.data.rng.uniform(600, 1200)
+        game.data.enemies.append(BasicLazerUnit(game.enemy_faction, player.x + math.cos(angle) * dis,
+                                                player.y + math.sin(angle) * dis,
+                                                color=constants.ENEMY_COLOR))
+
+
+def scenario_crowd(game: Game):
+    """300 Units packed around a UnitMothership, like its spawn area after a few bursts, pushing each other apart."""
+    player = game.data.player
+    _make_immortal(player)
+    game.data.enemies[:] = []
+    x, y = constants.MAP_WIDTH / 4, constants.MAP_HEIGHT / 4
+    game.data.enemies.append(UnitMothership(game.enemy_faction, x, y, color=constants.ENEMY_COLOR))
+    for _ in range(300):
+        angle = game.data.rng.uniform(-math.pi, math.pi)
+        dis = game.data.rng.uniform(150, 350)
+        game.data.enemies.append(Unit(game.enemy_faction, x + math.cos(angle) * dis, y + math.sin(angle) * dis,
+                                      color=constants.ENEMY_COLOR))
+
+
+def scenario_water(game: Game):
+    """A water blob orbiting the player, growing by 15 particles a tick up to WATER_PARTICLE_BUDGET * 2."""
+    player = game.data.player
+    _make_immortal(player)
+    water = game.data.water_particle_handler
+    water.particle_budget = WATER_PARTICLE_BUDGET
+    for _ in range(15):
+        water.spawn_at(player.x, player.y)
+    water.orbited_particle = WaterParticle(player.x, player.y, 0, 0, lifespan=IMMORTAL_HP)
+    water.orbit_acceleration = 0.1
+
+
+SCENARIOS: dict[str, Callable[[Game], None]] = {
+    "opening": scenario_opening,
+    "fireworks": scenario_fireworks,
+    "lazer_duel": scenario_lazer_duel,
+    "swarm": scenario_swarm,
+    "crowd": scenario_crowd,
+    "water": scenario_water,
+}
+
+
+def _distribution(values: list[float]) -> dict[str, float]:
+    values = sorted(values)
+    if not values:
+        return {}
+
+    def percentile(p):
+        return values[min(len(values) - 1, int(len(values) * p))]
+
+    return {
+        "mean": sum(values) / len(values),
+        "p50": percentile(0.50),
+        "p95": percentile(0.95),
+        "p99": percentile(0.99),
+        "max": values[-1],
+    }
+
+
+def run_scenario(name: str, ticks: int, seed: int) -> dict:
+    game = Game(headless=True, seed=seed)
+    SCENARIOS[name](game)
+
+    rows: list[dict[str, float]] = []
+    peak_entities = 0
+    candidate_pairs = 0
+    pair_counts = numpy.zeros((LAYER_COUNT, LAYER_COUNT), dtype=numpy.int64)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        if not game.data.running:
+            break
+        game.profiler.start_frame()
+        game.update()
+        rows.append(game.profiler.end_frame())
+        peak_entities = max(peak_entities, len(game.data.allies) + len(game.data.enemies) + len(game.data.effects)
+                            + len(game.data.debris))
+        candidate_pairs += game.data.candidate_pair_count
+        pair_counts += game.data.pair_counts
+    seconds = time.perf_counter() - start
+    ticks_run = max(len(rows), 1)
+
+    return {
+        "seed": seed,
+        "ticks": len(rows),
+        "seconds": seconds,
+        "ticks_per_second": len(rows) / max(seconds, 1e-9),
+        "peak_entities": peak_entities,
+        "candidate_pairs_per_tick": candidate_pairs / ticks_run,
+        "pairs_per_tick": {f"{LAYER_NAMES[a]}-{LAYER_NAMES[b]}": pair_counts[a, b] / ticks_run
+                           for a, b in zip(*(axis.tolist() for axis in numpy.nonzero(pair_counts)))},
+        "phases_ms": {phase: _distribution([row[phase] for row in rows])
+                      for phase in PROFILED_PHASES + ["frame"] if phase != "draw"},
+    }
+
+
+def _entity_factories(game: Game) -> dict[str, Callable[[], Particle]]:
+    faction = game.ally_faction
+    player = game.data.player
+    return {
+        "Particle": lambda: Particle(100.0, 100.0, 0.5, 2.0, 3.0),
+        "GameParticle": lambda: GameParticle(100.0, 100.0, 0.5, 2.0, 3.0),
+        "FactionParticle": lambda: FactionParticle(faction, 100.0, 100.0, 0.5, 2.0, 3.0),
+        "Bullet": lambda: Bullet(faction, 100.0, 100.0, 0.5),
+        "Lazer": lambda: Lazer(faction, 100.0, 100.0, 0.5),
+        "Missile": lambda: Missile(faction, 100.0, 100.0, 0.5),
+        "Effect": lambda: Effect(game.data, 100.0, 100.0, 0.5),
+        "Shield": lambda: Shield(faction, 100.0, 100.0, parent=player),
+        "BaseUnit": lambda: BaseUnit(faction, 100.0, 100.0),
+        "Unit": lambda: Unit(faction, 100.0, 100.0),
+        "BasicLazerUnit": lambda: BasicLazerUnit(faction, 100.0, 100.0),
+        "UnitMothership": lambda: UnitMothership(faction, 100.0, 100.0),
+    }
+
+
+def _attribute_throughput(entities: list[Particle], repeat: int) -> tuple[float, float]:
+    """:return: (reads, writes) of x, y and rad per second over entities"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for entity in entities:
+            entity.x
+            entity.y
+            entity.rad
+    reads = 3 * repeat * len(entities) / (time.perf_counter() - start)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for entity in entities:
+            entity.x = 1.0
+            entity.y = 1.0
+            entity.rad = 1.0
+    writes = 3 * repeat * len(entities) / (time.perf_counter() - start)
+    return reads, writes
+
+
+def run_entities(count: int, seed: int) -> dict:
+    """
+    Bytes per instance of every entity type, with what its constructor allocates (weapons, controller),
+    how long it takes to build one, and how fast their attributes are read and written.
+    Entities are built but never added to the game.
+    """
+    game = Game(headless=True, seed=seed)
+    results = {}
+    for name, factory in _entity_factories(game).items():
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        entities = [factory() for _ in range(count)]
+        size = (tracemalloc.get_traced_memory()[0] - before) / count
+        tracemalloc.stop()
+        start = time.perf_counter()
+        for _ in range(count):
+            factory()
+        build_time = (time.perf_counter() - start) / count
+        # units park their shields in the faction's list
+        game.data.allies.clear()
+        reads, writes = _attribute_throughput(entities, max(1, 200000 // count))
+        results[name] = {"bytes": size, "build_us": build_time * 1e6,
+                         "reads_per_second": reads, "writes_per_second": writes}
+    return results
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run seeded headless scenarios and report frame times per phase")
+    parser.add_argument("scenarios", nargs="*", metavar="SCENARIO",
+                        help=f"scenarios to run, all of them by default ({', '.join(SCENARIOS)})")
+    parser.add_argument("--ticks", type=int, default=constants.FPS * 20, help="ticks per scenario")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="benchmark_results.json", help="where to write the JSON results")
+    parser.add_argument("--entities", type=int, default=0, metavar="COUNT",
+                        help="instead of the scenarios, measure bytes and attribute access per entity type "
+                             "over COUNT instances each")
+    args = parser.parse_args()
+    for name in args.scenarios:
+        if name not in SCENARIOS:
+            parser.error(f"unknown scenario {name!r}")
+
+    results = {
+        "commit": _git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "fps": constants.FPS,
+        "scenarios": {},
+    }
+    if args.entities:
+        results["entities"] = run_entities(args.entities, args.seed)
+        for name, result in results["entities"].items():
+            print(f"{name:16} {result['bytes']:8.0f} bytes  {result['build_us']:7.1f} us to build  "
+                  f"{result['reads_per_second'] / 1e6:6.1f} M reads/s  "
+                  f"{result['writes_per_second'] / 1e6:6.1f} M writes/s")
+    for name in [] if args.entities else args.scenarios or list(SCENARIOS):
+        result = run_scenario(name, args.ticks, args.seed)
+        results["scenarios"][name] = result
+        frame = result["phases_ms"]["frame"]
+        print(f"{name:12} {result['ticks']:6} ticks {result['ticks_per_second']:8.1f} ticks/s  "
+              f"frame mean {frame['mean']:6.2f} p95 {frame['p95']:6.2f} max {frame['max']:7.2f} ms  "
+              f"peak entities {result['peak_entities']}  pairs {sum(result['pairs_per_tick'].values()):.0f} "
+              f"of {result['candidate_pairs_per_tick']:.0f} per tick")
+
+    with open(args.out, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"results written to {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,108 +1,185 @@
-from __future__ import annotations
-
-import math
-from typing import Callable, Any
-
-from srcs.classes import algo
-from srcs.classes.entity.breakable import Breakable
-from srcs.classes.entity.game_particle import GameParticle
-from srcs.classes.entity.lazer import Lazer
-from collections import defaultdict
-from typing import Sequence
-
-
-from srcs.classes.collision_handler import CollisionHandlerType, damaging_collision
-
-
-def is_colliding(a: GameParticle, b: GameParticle):
-    if isinstance(a, Lazer) and isinstance(b, Lazer):
-        # return algo.line_line_distance(a.x, a.y, a.end_x, a.end_y, b.x, b.y, b.end_x,
-        #                                b.end_y) < a.rad + b.rad
-        return False
-    elif isinstance(a, Lazer):
-        return algo.line_point_distance(a.prev_x, a.prev_y, a.end_x, a.end_y, b.x, b.y) < a.rad + b.rad
-    elif isinstance(b, Lazer):
-        return algo.line_point_distance(b.prev_x, b.prev_y, b.end_x, b.end_y, a.x, a.y) < a.rad + b.rad
-    else:
-        return a.distance_with(b) < 0
-
-def assign_to_cells(particles: Sequence[GameParticle], cell_size: float) -> dict:
-    """
-    Assigns particles to grid cells based on their positions.
-    """
-    cells = defaultdict(list)
-    for particle in particles:
-        cell_x = int(particle.x // cell_size)
-        cell_y = int(particle.y // cell_size)
-        cells[(cell_x, cell_y)].append(particle)
-    return cells
-
-
-def get_neighboring_cells(cell_x: int, cell_y: int) -> list:
-    """
-    Returns the coordinates of a cell and its eight neighbors.
-    """
-    return [
-        (cell_x + dx, cell_y + dy)
-        for dx in range(-1, 2)
-        for dy in range(-1, 2)
-    ]
-
-
-def check_collision_within_cells(bullets: Sequence[GameParticle], enemies: Sequence[GameParticle], cell_size: float):
-    """
-    Detects collisions between bullets and enemies using cell-based spatial partitioning.
-    """
-    # Step 1: Assign bullets and enemies to cells
-    bullet_cells = assign_to_cells(bullets, cell_size)
-    enemy_cells = assign_to_cells(enemies, cell_size)
-
-    # Step 2: Check collisions within the relevant cells
-    for (cell_x, cell_y), cell_bullets in bullet_cells.items():
-        # Get all enemies in this cell and neighboring cells
-        possible_enemies = []
-        for neighbor in get_neighboring_cells(cell_x, cell_y):
-            possible_enemies.extend(enemy_cells.get(neighbor, []))
-
-        # Check collisions between bullets and these enemies
-        for bullet in cell_bullets:
-            for enemy in possible_enemies:
-                if is_colliding(bullet, enemy):
-                    damaging_collision(bullet, enemy)
-
-def check_collision_with_enemies(bullet: GameParticle, enemies: list[GameParticle], start_idx: int,
-                                 collision_handler:CollisionHandlerType = damaging_collision):
-    for enemy in enemies[start_idx:]:
-        if enemy.x + enemy.get_collision_rad() < bullet.x - bullet.get_collision_rad():
-            start_idx += 1
-            continue
-        break
-    for enemy in enemies[start_idx:]:
-        if enemy.x - enemy.get_collision_rad() > bullet.x + bullet.get_collision_rad():
-            break
-        if is_colliding(bullet, enemy):
-            collision_handler(bullet, enemy)
-    return start_idx
-
-
-def _collide_sorted_enemy_and_bullets(bullets: list[GameParticle], enemies: list[GameParticle],
-                                      collision_handler:CollisionHandlerType = damaging_collision):
-    enemy_start_idx = 0
-    for bullet in bullets:
-        enemy_start_idx = check_collision_with_enemies(bullet, enemies, enemy_start_idx, collision_handler)
-        if enemy_start_idx >= len(enemies):
-            break
-
-
-def collide_enemy_and_bullets(bullets: Sequence[GameParticle], enemies: Sequence[GameParticle],
-                              collision_handler: CollisionHandlerType = damaging_collision):
-    bullets = sorted(bullets, key=lambda b: b.x - b.get_collision_rad())
-    enemies = sorted(enemies, key=lambda b: b.x - b.get_collision_rad())
-    # sep
-    GROUP = [(0, 10), (10, 20), (20, float('inf'))]
-
-    enemy_groups = [[p for p in enemies if left < p.get_collision_rad() <= right] for left, right in GROUP]
-    bullet_groups = [[p for p in bullets if left < p.get_collision_rad() <= right] for left, right in GROUP]
-    for enemy_group in enemy_groups:
-        for bullet_group in bullet_groups:
-            _collide_sorted_enemy_and_bullets(bullet_group, enemy_group, collision_handler)
+from __future__ import annotations
+
+import math
+import random
+from typing import Callable
+
+from srcs.classes import algo
+from srcs.classes.collision_layers import layer_of, LAYER_COUNT, NO_LAYER, LAZER
+from srcs.classes.entity.game_particle import GameParticle
+from srcs.classes.entity.lazer import Lazer
+from typing import Sequence
+
+import numpy as np
+
+
+from srcs.classes.collision_handler import resolve_hit
+from srcs.classes.damage_buffer import DamageBuffer
+from srcs.constants import SEPARATION_ITERATIONS
+
+
+def circles_touch(a: GameParticle, b: GameParticle) -> bool:
+    return math.hypot(a.x - b.x, a.y - b.y) < a.rad + b.rad
+
+
+def beam_touches(l: Lazer, p: GameParticle) -> bool:
+    """The beam sweeps from where it started this tick, so a fast beam doesn't skip over p"""
+    return algo.line_point_distance(l.prev_x, l.prev_y, l.end_x, l.end_y, p.x, p.y) < l.rad + p.rad
+
+
+def beams_touch(a: Lazer, b: Lazer) -> bool:
+    return algo.line_line_distance(a.prev_x, a.prev_y, a.end_x, a.end_y,
+                                   b.prev_x, b.prev_y, b.end_x, b.end_y) < a.rad + b.rad
+
+
+def _never(a: GameParticle, b: GameParticle) -> bool:
+    return False
+
+
+def _touch_table() -> list[list[Callable[[GameParticle, GameParticle], bool]]]:
+    table = [[circles_touch] * LAYER_COUNT for _ in range(LAYER_COUNT)]
+    for layer in range(LAYER_COUNT):
+        table[LAZER][layer] = beam_touches
+        table[layer][LAZER] = lambda a, b: beam_touches(b, a)
+        table[NO_LAYER][layer] = table[layer][NO_LAYER] = _never
+    table[LAZER][LAZER] = beams_touch
+    return table
+
+
+# the narrowphase test of a pair, TOUCH_TESTS[layer of a][layer of b](a, b)
+TOUCH_TESTS = _touch_table()
+
+
+def is_colliding(a: GameParticle, b: GameParticle):
+    return TOUCH_TESTS[layer_of(a)][layer_of(b)](a, b)
+
+
+def touching_mask(particles: Sequence[GameParticle], first: np.ndarray, second: np.ndarray, layers: np.ndarray,
+                  x: np.ndarray, y: np.ndarray, rad: np.ndarray) -> np.ndarray:
+    """
+    circles_touch() and beam_touches() for all the pairs at once. Pairs of two beams go through
+    beams_touch() one by one, there are too few of them to be worth it.
+
+    :param x, y, rad: of each of the particles; the rad of beams isn't used, their ends and rad are read
+                      from the beams themselves
+    :return: mask of the pairs that touch
+    """
+    layer_a, layer_b = layers[first], layers[second]
+    beam_a, beam_b = layer_a == LAZER, layer_b == LAZER
+    touching = np.zeros(first.size, dtype=bool)
+
+    both_beams = np.flatnonzero(beam_a & beam_b)
+    touching[both_beams] = [beams_touch(particles[a], particles[b])
+                            for a, b in zip(first[both_beams].tolist(), second[both_beams].tolist())]
+
+    circles = np.flatnonzero(~beam_a & ~beam_b)
+    i, j = first[circles], second[circles]
+    touching[circles] = np.hypot(x[i] - x[j], y[i] - y[j]) < rad[i] + rad[j]
+
+    one_beam = np.flatnonzero(beam_a ^ beam_b)
+    if one_beam.size:
+        beam = np.where(beam_a[one_beam], first[one_beam], second[one_beam])
+        point = np.where(beam_a[one_beam], second[one_beam], first[one_beam])
+        beams, inverse = np.unique(beam, return_inverse=True)
+        lazers = [particles[k] for k in beams.tolist()]
+        n = len(lazers)
+        x1 = np.fromiter((l.prev_x for l in lazers), dtype=np.float64, count=n)[inverse]
+        y1 = np.fromiter((l.prev_y for l in lazers), dtype=np.float64, count=n)[inverse]
+        x2 = np.fromiter((l.end_x for l in lazers), dtype=np.float64, count=n)[inverse]
+        y2 = np.fromiter((l.end_y for l in lazers), dtype=np.float64, count=n)[inverse]
+        beam_rad = np.fromiter((l.rad for l in lazers), dtype=np.float64, count=n)[inverse]
+        # algo.line_point_distance, closest point clamped to the segment
+        dx, dy = x2 - x1, y2 - y1
+        length_squared = dx * dx + dy * dy
+        px, py = x[point], y[point]
+        t = np.divide((px - x1) * dx + (py - y1) * dy, length_squared,
+                      out=np.zeros(one_beam.size), where=length_squared > 0)
+        t = np.clip(t, 0.0, 1.0)
+        touching[one_beam] = np.hypot(px - x1 - t * dx, py - y1 - t * dy) < beam_rad + rad[point]
+
+    return touching & (layer_a != NO_LAYER) & (layer_b != NO_LAYER)
+
+
+def collide_pairs(particles: Sequence[GameParticle], first: np.ndarray, second: np.ndarray, layers: np.ndarray,
+                  x: np.ndarray, y: np.ndarray, rad: np.ndarray, damage: DamageBuffer):
+    """
+    Narrow phase over broadphase candidates: touching_mask() drops the misses, most of them, in one go and
+    only the hits go through the damage handler of their two layers (collision_handler.DAMAGE_HANDLERS),
+    so nothing is looked up by type per pair. The hits are recorded in damage, damage.resolve() applies them.
+
+    A hit sees the hits before it through damage.hp_of(), so a bullet used up by one target deals nothing
+    to the next. Hits go nearest first, so which ones a bullet gets to doesn't depend on the pair order.
+    Beams are cut by what they hit, so their hits go last and nearest to the beam's start first; the
+    damage handlers drop those past where the beam is cut.
+
+    :param layers: the layer of each of the particles, collision_layers.layer_of()
+    :param x, y, rad: of each of the particles, see touching_mask()
+    """
+    if not first.size:
+        return
+    hits = touching_mask(particles, first, second, layers, x, y, rad)
+    first, second = first[hits], second[hits]
+    layer_a, layer_b = layers[first], layers[second]
+    beam_a = layer_a == LAZER
+    has_beam = beam_a | (layer_b == LAZER)
+    beam = np.where(beam_a, first, second)
+    other = np.where(beam_a, second, first)
+    reach = np.hypot(x[other] - x[beam], y[other] - y[beam])
+    order = np.lexsort((reach, has_beam))
+    first, second, layer_a, layer_b = first[order], second[order], layer_a[order], layer_b[order]
+    for a, b, la, lb in zip(first.tolist(), second.tolist(), layer_a.tolist(), layer_b.tolist()):
+        resolve_hit(particles[a], particles[b], la, lb, damage)
+
+
+def separate_pairs(particles: Sequence[GameParticle], first: np.ndarray, second: np.ndarray, rng: random.Random,
+                   iterations: int = SEPARATION_ITERATIONS):
+    """
+    repel_collision() over every candidate pair at once, for crowds of units on the same side. Both units of
+    an overlapping pair are pushed apart, sharing the overlap by size like masses would: two of a kind split it,
+    a small unit against a mothership takes nearly all of it. The pushes are summed per particle and applied
+    together; each iteration pushes again from where the last one left them, so crowds spread out in fewer ticks.
+
+    :param first, second: broadphase candidates, each pair once
+    :param rng: picks the direction for pairs on the exact same spot
+    """
+    if not first.size:
+        return
+    involved, inverse = np.unique(np.concatenate((first, second)), return_inverse=True)
+    members = [particles[k] for k in involved.tolist()]
+    n = len(members)
+    x = np.fromiter((p.x for p in members), dtype=np.float64, count=n)
+    y = np.fromiter((p.y for p in members), dtype=np.float64, count=n)
+    rad = np.fromiter((p.rad for p in members), dtype=np.float64, count=n)
+    alive = np.fromiter((p.hp > 0 and not p.is_dead() for p in members), dtype=bool, count=n)
+    a, b = inverse[:first.size], inverse[first.size:]
+    keep = alive[a] & alive[b]
+    a, b = a[keep], b[keep]
+    reach = rad[a] + rad[b]
+    # a's share of the overlap, mass going with the area
+    share = rad[b] ** 2 / np.maximum(rad[a] ** 2 + rad[b] ** 2, 1e-9)
+    start_x, start_y = x.copy(), y.copy()
+
+    for _ in range(iterations):
+        dx = x[a] - x[b]
+        dy = y[a] - y[b]
+        distance = np.hypot(dx, dy)
+        overlapping = np.flatnonzero(distance < reach)
+        if not overlapping.size:
+            break
+        i, j, dx, dy, distance = a[overlapping], b[overlapping], dx[overlapping], dy[overlapping], distance[overlapping]
+        same_spot = np.flatnonzero(distance == 0)
+        for k in same_spot.tolist():
+            dy[k] = rng.uniform(-0.1, 0.1)
+            dx[k] = rng.uniform(-0.1, 0.1)
+        if same_spot.size:
+            distance = np.hypot(dx, dy)
+        push = (reach[overlapping] - distance) / distance
+        on_i = share[overlapping] * push
+        on_j = on_i - push
+        x += np.bincount(i, weights=dx * on_i, minlength=n) + np.bincount(j, weights=dx * on_j, minlength=n)
+        y += np.bincount(i, weights=dy * on_i, minlength=n) + np.bincount(j, weights=dy * on_j, minlength=n)
+
+    moved = np.flatnonzero((x != start_x) | (y != start_y))
+    for k, new_x, new_y in zip(moved.tolist(), x[moved].tolist(), y[moved].tolist()):
+        members[k].x = new_x
+        members[k].y = new_y
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+
+class Camera:
+    """
+    Map to screen transform of the frame being drawn. Everything draws straight to the screen:
+    what is at (x, y) on the map goes to to_screen(x, y), and lengths are scaled by zoom.
+    """
+    __slots__ = ("x", "y", "zoom")
+
+    def __init__(self, x: float = 0.0, y: float = 0.0, zoom: float = 1.0):
+        self.x: float = x  # map position of the screen's top left corner
+        self.y: float = y
+        self.zoom: float = zoom
+
+    def to_screen(self, x: float, y: float) -> tuple[float, float]:
+        return (x - self.x) * self.zoom, (y - self.y) * self.zoom
+
+    def scale(self, length: float) -> float:
+        return length * self.zoom
+
+    def view(self, width: int, height: int) -> tuple[float, float, float, float]:
+        """:return: (left, top, right, bottom) of the map seen on a (width, height) screen"""
+        return self.x, self.y, self.x + width / self.zoom, self.y + height / self.zoom
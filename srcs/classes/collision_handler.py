@@ -1,70 +1,125 @@
-from __future__ import annotations
-
-import math
-from typing import Callable, Any
-import random
-
-from srcs.classes import algo
-from srcs.classes.entity.breakable import Breakable
-from srcs.classes.entity.game_particle import GameParticle
-from srcs.classes.entity.lazer import Lazer
-
-CollisionHandlerType = Callable[[GameParticle, GameParticle], Any]
-
-def lazer_unit_collision(l: Lazer, p: GameParticle):
-    # print(f"before: {l.hp:.2f} {p.hp:.2f}")
-    intersect = algo.line_circle_first_intersect(l.x, l.y, l.end_x, l.end_y, p.x, p.y, p.rad)
-    if intersect is None:
-        intersect = [l.x, l.y]
-        distance = 0
-    else:
-        distance = math.hypot(intersect[0] - l.x, intersect[1] - l.y)
-    # dmg factor enough to kill either (or both survives)
-    dmg_factor = abs(l.hp - (distance / l.rad))
-    dmg_factor = min(dmg_factor, p.hp / max(0.1 ,l.dmg))
-
-    l.hp -= min(1.0, p.dmg) * dmg_factor
-    p.hp -= l.dmg * dmg_factor
-    l.update_length()
-    # print(f"after: ({intersect[0]:.2f}, {intersect[1]:.2f}) {distance=:.2f} {dmg_factor=:.2f}, {l.hp:.2f} {p.hp:.2f}")
-
-
-def damaging_collision(bullet: GameParticle, enemy: GameParticle):
-    if bullet is enemy or bullet.is_dead() or bullet.hp <= 0 or enemy.is_dead() or enemy.hp <= 0:
-        return
-    elif isinstance(bullet, Lazer) and not isinstance(enemy, Lazer):
-        lazer_unit_collision(bullet, enemy)
-    elif isinstance(enemy, Lazer) and not isinstance(bullet, Lazer):
-        lazer_unit_collision(enemy, bullet)
-    else:
-        enemy.hp -= bullet.dmg
-        bullet.hp -= enemy.dmg
-
-    if enemy.is_dead():
-        bullet.add_score(enemy.base_score)
-    if bullet.is_dead():
-        enemy.add_score(enemy.base_score)
-    if isinstance(enemy, Breakable):
-        enemy.handle_hit_by(bullet)
-    if isinstance(bullet, Breakable):
-        bullet.handle_hit_by(enemy)
-
-def repel_collision(a: GameParticle, b: GameParticle):
-    if (a is b) or a.is_dead() or a.hp <= 0 or b.is_dead() or b.hp <= 0:
-        return
-    elif isinstance(a, Lazer) or isinstance(b, Lazer):
-        return
-
-    if a.rad > b.rad:
-        a, b = b, a
-    dy = a.y - b.y
-    dx = a.x - b.x
-    dis = math.hypot(dy, dx)
-    if dis == 0:
-        dy = random.uniform(-0.1, 0.1)
-        dx = random.uniform(-0.1, 0.1)
-        dis = math.hypot(dy, dx)
-    # a is smaller than b, a gets repelled
-    overlap = a.rad + b.rad - dis
-    a.x += dx / dis * overlap
+from __future__ import annotations
+
+import math
+from typing import Callable, Any
+
+from srcs.classes import algo
+from srcs.classes.collision_layers import layer_of, LAYER_COUNT, NO_LAYER, UNIT, LAZER
+from srcs.classes.damage_buffer import DamageBuffer
+from srcs.classes.entity.game_particle import GameParticle
+from srcs.classes.entity.lazer import Lazer
+
+CollisionHandlerType = Callable[[GameParticle, GameParticle], Any]
+DamageHandlerType = Callable[[GameParticle, GameParticle, DamageBuffer], 'tuple[float, float] | None']
+
+def lazer_unit_collision(l: Lazer, p: GameParticle, damage: DamageBuffer) -> tuple[float, float] | None:
+    hp_l, hp_p = damage.hp_of(l), damage.hp_of(p)
+    intersect = algo.line_circle_first_intersect(l.x, l.y, l.end_x, l.end_y, p.x, p.y, p.rad)
+    if intersect is None:
+        distance = 0
+    else:
+        distance = math.hypot(intersect[0] - l.x, intersect[1] - l.y)
+    # the length of beam past p
+    dmg_factor = hp_l - (distance / l.rad)
+    if dmg_factor <= 0:
+        # cut short of p by an earlier hit of the pass
+        return None
+    # dmg factor enough to kill either (or both survives)
+    dmg_factor = min(dmg_factor, max(0.0, hp_p) / max(0.1, l.dmg))
+    return min(1.0, p.dmg) * dmg_factor, l.dmg * dmg_factor
+
+
+def _past_start(l: Lazer, t: float) -> float:
+    """How far past l's start the point at t of its swept segment (prev_x, prev_y) -> end is, 0 if behind it"""
+    x = l.prev_x + (l.end_x - l.prev_x) * t
+    y = l.prev_y + (l.end_y - l.prev_y) * t
+    return max(0.0, (x - l.x) * math.cos(l.angle) + (y - l.y) * math.sin(l.angle))
+
+
+def lazer_lazer_collision(a: Lazer, b: Lazer, damage: DamageBuffer) -> tuple[float, float] | None:
+    """
+    Crossing beams cut each other at the crossing, each losing the length past it the way a beam does
+    against a unit, scaled by the other beam's dmg. The crossing is on the swept segments beams_touch() tests.
+    """
+    t, u, _ = algo.line_line_closest_params(a.prev_x, a.prev_y, a.end_x, a.end_y,
+                                            b.prev_x, b.prev_y, b.end_x, b.end_y)
+    dmg_factor_a = damage.hp_of(a) - _past_start(a, t) / a.rad
+    dmg_factor_b = damage.hp_of(b) - _past_start(b, u) / b.rad
+    if dmg_factor_a <= 0 or dmg_factor_b <= 0:
+        return None
+    return min(1.0, b.dmg) * dmg_factor_a, min(1.0, a.dmg) * dmg_factor_b
+
+
+def exchange_damage(a: GameParticle, b: GameParticle, damage: DamageBuffer) -> tuple[float, float]:
+    return b.dmg, a.dmg
+
+
+def _swapped(handler: DamageHandlerType) -> DamageHandlerType:
+    def swapped(a: GameParticle, b: GameParticle, damage: DamageBuffer):
+        dealt = handler(b, a, damage)
+        return None if dealt is None else (dealt[1], dealt[0])
+    return swapped
+
+
+def _no_damage(a: GameParticle, b: GameParticle, damage: DamageBuffer):
+    return None
+
+
+def _damage_table() -> list[list[DamageHandlerType]]:
+    table = [[exchange_damage] * LAYER_COUNT for _ in range(LAYER_COUNT)]
+    for layer in range(LAYER_COUNT):
+        table[LAZER][layer] = lazer_unit_collision
+        table[layer][LAZER] = _swapped(lazer_unit_collision)
+        table[NO_LAYER][layer] = table[layer][NO_LAYER] = _no_damage
+    table[LAZER][LAZER] = lazer_lazer_collision
+    return table
+
+
+# the damage a hit deals to both particles, DAMAGE_HANDLERS[layer of a][layer of b](a, b, damage) -> (to a, to b),
+# None if it doesn't reach; beams read what they lost earlier in the pass from damage
+DAMAGE_HANDLERS = _damage_table()
+
+
+def resolve_hit(bullet: GameParticle, enemy: GameParticle, bullet_layer: int, enemy_layer: int,
+                damage: DamageBuffer):
+    """
+    Record the hit between bullet and enemy in damage, damage.resolve() applies it. Neither takes part
+    if the hits recorded before it already used up its hp.
+    """
+    if bullet is enemy or bullet.is_dead() or enemy.is_dead() or damage.hp_of(bullet) <= 0 or damage.hp_of(enemy) <= 0:
+        return
+    dealt = DAMAGE_HANDLERS[bullet_layer][enemy_layer](bullet, enemy, damage)
+    if dealt is None:
+        return
+    to_bullet, to_enemy = dealt
+    # the unit layer is the Breakables
+    damage.hit(enemy, to_enemy, bullet, enemy.base_score, bullet if enemy_layer == UNIT else None)
+    damage.hit(bullet, to_bullet, enemy, enemy.base_score, enemy if bullet_layer == UNIT else None)
+
+
+def damaging_collision(bullet: GameParticle, enemy: GameParticle):
+    """One hit, applied right away"""
+    damage = DamageBuffer()
+    resolve_hit(bullet, enemy, layer_of(bullet), layer_of(enemy), damage)
+    damage.resolve()
+
+def repel_collision(a: GameParticle, b: GameParticle):
+    if (a is b) or a.is_dead() or a.hp <= 0 or b.is_dead() or b.hp <= 0:
+        return
+    elif isinstance(a, Lazer) or isinstance(b, Lazer):
+        return
+
+    if a.rad > b.rad:
+        a, b = b, a
+    dy = a.y - b.y
+    dx = a.x - b.x
+    dis = math.hypot(dy, dx)
+    if dis == 0:
+        rng = a.faction.game_data.rng
+        dy = rng.uniform(-0.1, 0.1)
+        dx = rng.uniform(-0.1, 0.1)
+        dis = math.hypot(dy, dx)
+    # a is smaller than b, a gets repelled
+    overlap = a.rad + b.rad - dis
+    a.x += dx / dis * overlap
     a.y += dy / dis * overlap
\ No newline at end of file
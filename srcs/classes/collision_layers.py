@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import numpy as np
+
+from srcs.classes.entity.breakable import Breakable
+from srcs.classes.entity.bullet import Bullet
+from srcs.classes.entity.game_particle import GameParticle
+from srcs.classes.entity.lazer import Lazer
+from srcs.classes.entity.shield import Shield
+
+# Every particle in the faction lists is in one layer, and the matrices below say which layers can touch.
+# Game.collide_everything drops the candidate pairs of layers that don't before any narrowphase runs.
+NO_LAYER, UNIT, BULLET, LAZER, SHIELD = range(5)
+LAYER_NAMES = ("none", "unit", "bullet", "lazer", "shield")
+LAYER_COUNT = len(LAYER_NAMES)
+
+
+def _matrix(pairs: list[tuple[int, int]]) -> np.ndarray:
+    matrix = np.zeros((LAYER_COUNT, LAYER_COUNT), dtype=bool)
+    for a, b in pairs:
+        matrix[a, b] = matrix[b, a] = True
+    return matrix
+
+
+# damaging_collision() between the two sides; bullets shooting down bullets is on purpose (sub shield),
+# crossing lazers cut each other
+OPPOSING = _matrix([
+    (UNIT, UNIT), (UNIT, BULLET), (UNIT, LAZER), (UNIT, SHIELD),
+    (BULLET, BULLET), (BULLET, LAZER), (BULLET, SHIELD),
+    (LAZER, LAZER), (LAZER, SHIELD),
+    (SHIELD, SHIELD),
+])
+# separate_pairs() within a side
+SAME_SIDE = _matrix([(UNIT, UNIT)])
+# what the particles queried against the grid instead of being in it hit, by the layer they hit
+WATER_HITS = np.arange(LAYER_COUNT) != NO_LAYER
+DEBRIS_HITS = np.arange(LAYER_COUNT) == UNIT
+
+_type_layers: dict[type, int] = {}
+
+
+def _layer_of_type(particle_type: type) -> int:
+    if issubclass(particle_type, Lazer):
+        return LAZER
+    if issubclass(particle_type, Shield):
+        return SHIELD
+    if issubclass(particle_type, Breakable):
+        return UNIT
+    # Bullet, Explosive, Missile and whatever else damages on contact
+    return BULLET
+
+
+def layer_of(particle: GameParticle) -> int:
+    """The layer of particle's type, looked up once per type"""
+    layer = _type_layers.get(type(particle))
+    if layer is None:
+        layer = _type_layers[type(particle)] = _layer_of_type(type(particle))
+    # units without a shield still carry one, with no radius
+    if layer == SHIELD and particle.max_rad <= 0:
+        return NO_LAYER
+    return layer
+
+
+def count_pairs(layer_i: np.ndarray, layer_j: np.ndarray) -> np.ndarray:
+    """:return: (LAYER_COUNT, LAYER_COUNT) pair counts, each pair counted under [lower layer, higher layer]"""
+    low = np.minimum(layer_i, layer_j)
+    high = np.maximum(layer_i, layer_j)
+    return np.bincount(low * LAYER_COUNT + high, minlength=LAYER_COUNT ** 2).reshape(LAYER_COUNT, LAYER_COUNT)
+
+
+def format_pair_counts(counts: np.ndarray) -> str:
+    """Non-zero counts as "unit-bullet 12, bullet-bullet 3", highest first"""
+    low, high = np.nonzero(counts)
+    order = np.argsort(-counts[low, high], kind="stable")
+    return ", ".join(f"{LAYER_NAMES[a]}-{LAYER_NAMES[b]} {counts[a, b]}"
+                     for a, b in zip(low[order].tolist(), high[order].tolist())) or "none"
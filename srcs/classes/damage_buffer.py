@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import numpy as np
+
+from srcs.classes.entity.breakable import Breakable
+from srcs.classes.entity.game_particle import GameParticle
+from srcs.classes.entity.lazer import Lazer
+
+
+class DamageBuffer:
+    """
+    The hits of one collision pass. Detection only records them with hit(), nothing loses hp, breaks or
+    scores until resolve() applies them all at once; hp_of() is what a particle has left for its next hit.
+    A particle hit several times in a pass breaks once, towards its biggest hit, and only the particle
+    that dealt the biggest hit gets the score if it dies.
+    """
+
+    def __init__(self):
+        self._damage: dict[GameParticle, float] = {}
+        # per particle, its biggest hit of the pass: (damage, scorer, score, hit)
+        self._biggest: dict[GameParticle, tuple] = {}
+        # (hp column, rows, damage) of particles that are only array rows (debris)
+        self._row_hits: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        self._credits: list[tuple[GameParticle, int]] = []
+
+    def __len__(self):
+        return len(self._damage)
+
+    def hp_of(self, particle: GameParticle) -> float:
+        """particle's hp once the hits recorded so far are applied"""
+        return particle.hp - self._damage.get(particle, 0.0)
+
+    def hit(self, victim: GameParticle, damage: float, scorer: GameParticle | None = None, score: int = 0,
+            hit: GameParticle | tuple[float, float, float] | None = None):
+        """
+        :param scorer: gets score if victim dies in this pass and this is its biggest hit
+        :param hit: what victim breaks from if this is its biggest hit, the particle that hit it
+                    (Breakable.handle_hit_by) or (angle, rad, speed) (Breakable.handle_hit_from)
+        """
+        self._damage[victim] = self._damage.get(victim, 0.0) + damage
+        biggest = self._biggest.get(victim)
+        if biggest is None or damage > biggest[0]:
+            self._biggest[victim] = (damage, scorer, score, hit)
+
+    def hit_rows(self, hp: np.ndarray, rows: np.ndarray, damage: np.ndarray):
+        """Hits on particles that are only rows of an hp column, each row hit once"""
+        self._row_hits.append((hp, rows, damage))
+
+    def credit(self, scorer: GameParticle, score: int):
+        """Score that doesn't depend on how the pass ends, given with the rest"""
+        self._credits.append((scorer, score))
+
+    def resolve(self):
+        """Apply every hit recorded since the last resolve(), scores and breaking go after all the damage"""
+        damage, biggest, row_hits, credits = self._damage, self._biggest, self._row_hits, self._credits
+        self._damage, self._biggest, self._row_hits, self._credits = {}, {}, [], []
+        for victim, amount in damage.items():
+            victim.hp -= amount
+            if isinstance(victim, Lazer):
+                victim.update_length()
+        for hp, rows, amount in row_hits:
+            hp[rows] -= amount
+        for scorer, score in credits:
+            scorer.add_score(score)
+        for victim, (_, scorer, score, hit) in biggest.items():
+            if scorer is not None and victim.is_dead():
+                scorer.add_score(score)
+            if hit is None or not isinstance(victim, Breakable):
+                continue
+            if isinstance(hit, tuple):
+                victim.handle_hit_from(*hit)
+            else:
+                victim.handle_hit_by(hit)
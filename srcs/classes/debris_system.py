@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import math
+import random
+
+import numpy as np
+import pygame
+
+from srcs import constants, utils
+from srcs.classes.camera import Camera
+from srcs.classes.damage_buffer import DamageBuffer
+from srcs.classes.effect import DEATH_OPACITY
+from srcs.classes.entity.breakable import Breakable
+from srcs.classes.entity.game_particle import GameParticle
+from srcs.classes.spatial_grid import SpatialGrid
+
+DEBRIS_LIFESPAN = 300
+DEBRIS_TARGET_RAD = 0.5
+# the three corners of a piece, around its orientation
+_CORNERS = np.arange(3) * 2 * math.pi / 3
+
+
+class DebrisSystem:
+    """
+    The pieces Breakables break into. They are only arrays: an explosion draws all of its pieces at
+    once, step() moves, shrinks, fades and spins all of them, and they never go through the faction
+    lists, so units don't target them and bullets don't collide with them. They only hit the other
+    side's units, see collide_with_units().
+    """
+
+    def __init__(self, rng: random.Random | None = None, capacity: int = constants.MAX_DEBRIS_COUNT):
+        self.rng: random.Random = rng if rng is not None else random.Random()
+        # seeded from rng so the game stays reproducible
+        self.np_rng: np.random.Generator = np.random.default_rng(self.rng.getrandbits(64))
+        self.capacity: int = capacity
+        self.size: int = 0
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.prev_x = np.zeros(capacity)
+        self.prev_y = np.zeros(capacity)
+        self.xv = np.zeros(capacity)
+        self.yv = np.zeros(capacity)
+        self.rad = np.zeros(capacity)
+        self.rad_increase_rate = np.zeros(capacity)
+        self.orientation = np.zeros(capacity)
+        self.angular_momentum = np.zeros(capacity)
+        self.hp = np.zeros(capacity)
+        self.dmg = np.zeros(capacity)
+        self.lifespan = np.zeros(capacity, dtype=np.int64)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        # which side it flew off from, it only hits the other side's units
+        self.ally = np.zeros(capacity, dtype=bool)
+        # the Breakable it came from, gets the score for what it kills
+        self.parent = np.full(capacity, None, dtype=object)
+        self._columns = (self.x, self.y, self.prev_x, self.prev_y, self.xv, self.yv, self.rad,
+                         self.rad_increase_rate, self.orientation, self.angular_momentum, self.hp, self.dmg,
+                         self.lifespan, self.color, self.ally, self.parent)
+
+    def __len__(self):
+        return self.size
+
+    def explode(self, source: Breakable, explode_hp: float, explode_angle: float, explode_spread: float,
+                spawn_center: tuple[float, float], spawn_rad: float, velocity_k: float = 1.0):
+        """
+        Break up to MAX_ENEMY_COUNT pieces off source, until they carry explode_hp away between them.
+        Every random draw of the explosion is one batch from np_rng.
+        """
+        cap = min(constants.MAX_ENEMY_COUNT, self.capacity - self.size)
+        if explode_hp <= 0 or cap <= 0:
+            return
+        k = 2.0
+        rng = self.np_rng
+        radius = rng.uniform(0.1, min(constants.UNIT_RADIUS * k, source.max_rad / 3), cap)
+        carried_hp = source.max_hp * (radius / source.rad) ** 2
+        # a piece breaks off while some of explode_hp is left before it
+        n = int(np.count_nonzero(np.cumsum(carried_hp) - carried_hp < explode_hp))
+        radius = radius[:n]
+        angle = explode_angle + rng.uniform(-explode_spread / 2, explode_spread / 2, n)
+        speed = (rng.uniform(constants.UNIT_SPEED * 2, constants.UNIT_SPEED * (10 + np.arange(n) / 4)) / radius
+                 * velocity_k)
+        hp = radius / 10
+
+        new = slice(self.size, self.size + n)
+        self.size += n
+        self.x[new] = self.prev_x[new] = spawn_center[0] + np.cos(angle) * (radius + spawn_rad)
+        self.y[new] = self.prev_y[new] = spawn_center[1] + np.sin(angle) * (radius + spawn_rad)
+        self.xv[new] = speed * np.cos(angle) + source.xv
+        self.yv[new] = speed * np.sin(angle) + source.yv
+        self.rad[new] = radius
+        self.rad_increase_rate[new] = (DEBRIS_TARGET_RAD - radius) / DEBRIS_LIFESPAN
+        self.orientation[new] = rng.uniform(0, 2 * math.pi, n)
+        self.angular_momentum[new] = rng.uniform(-math.pi * 2 / constants.FPS, math.pi * 2 / constants.FPS, n)
+        self.hp[new] = hp
+        self.dmg[new] = speed * hp
+        self.lifespan[new] = DEBRIS_LIFESPAN
+        self.color[new] = utils.color_mix(source.color, (255, 255, 255), weight2=2)
+        self.ally[new] = source.faction.parent_list is source.faction.game_data.allies
+        self.parent[new] = source
+
+    def step(self):
+        n = self.size
+        if not n:
+            return
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+        self.x[:n] += self.xv[:n]
+        self.y[:n] += self.yv[:n]
+        self.lifespan[:n] -= 1
+        self.rad[:n] += self.rad_increase_rate[:n]
+        self.orientation[:n] += self.angular_momentum[:n]
+
+    def collide_with_units(self, grid: SpatialGrid, candidates: np.ndarray, units: np.ndarray,
+                           damage: DamageBuffer):
+        """
+        The pieces hit units like bullets do (collision_handler.resolve_hit), but a piece only hits the
+        first unit it touches in a tick and never knocks anything back. Both sides of each hit are recorded
+        in damage; a unit that kills a piece is credited through it too, since a piece is only ever hit once.
+
+        :param candidates: pieces that might touch units, the pairs from grid.query_pairs()
+        :param units: indices into the grid's particles
+        """
+        x, y, rad, hp = self.x, self.y, self.rad, self.hp
+        dx = x[candidates] - grid.x[units]
+        dy = y[candidates] - grid.y[units]
+        touching = (np.hypot(dx, dy) < rad[candidates] + grid.rad[units]) & (hp[candidates] > 0)
+        candidates, first = np.unique(candidates[touching], return_index=True)
+        units = units[touching][first]
+        hit_angles = np.arctan2(dy[touching][first], dx[touching][first])
+        speeds = np.hypot(self.xv[candidates], self.yv[candidates])
+        dmgs = self.dmg[candidates]
+        rads = rad[candidates]
+        piece_hps = hp[candidates]
+
+        particles = grid.particles
+        hit_pieces, piece_damage = [], []
+        for piece, unit, hit_angle, speed, dmg, piece_rad, piece_hp in zip(
+                candidates.tolist(), units.tolist(), hit_angles.tolist(), speeds.tolist(), dmgs.tolist(),
+                rads.tolist(), piece_hps.tolist()):
+            unit = particles[unit]
+            if unit.is_dead() or damage.hp_of(unit) <= 0:
+                continue
+            parent = self.parent[piece]
+            damage.hit(unit, dmg, parent if isinstance(parent, GameParticle) else None, unit.base_score,
+                       (hit_angle, piece_rad, speed) if isinstance(unit, Breakable) else None)
+            hit_pieces.append(piece)
+            piece_damage.append(unit.dmg)
+            if piece_hp - unit.dmg <= 0:
+                damage.credit(unit, unit.base_score)
+        if hit_pieces:
+            damage.hit_rows(hp, np.array(hit_pieces), np.array(piece_damage))
+
+    def remove_dead(self):
+        """Out of hp, out of lifespan, or fully off the map"""
+        n = self.size
+        x, y, rad = self.x[:n], self.y[:n], self.rad[:n]
+        alive = np.flatnonzero((self.hp[:n] > 0) & (self.lifespan[:n] > 0)
+                               & (x + rad >= 0) & (x - rad <= constants.MAP_WIDTH)
+                               & (y + rad >= 0) & (y - rad <= constants.MAP_HEIGHT))
+        if alive.size == n:
+            return
+        for column in self._columns:
+            column[:alive.size] = column[alive]
+        self.parent[alive.size:n] = None
+        self.size = alive.size
+
+    def clear(self):
+        self.parent[:self.size] = None
+        self.size = 0
+
+    def draw(self, surface: pygame.Surface, camera: Camera, alpha: float = 1.0):
+        """
+        Triangles faded towards the background color, the ones off the surface aren't drawn.
+
+        :param alpha: how far between the last two ticks to draw, like Game.draw_everything
+        """
+        n = self.size
+        if not n:
+            return
+        x = self.prev_x[:n] + (self.x[:n] - self.prev_x[:n]) * alpha
+        y = self.prev_y[:n] + (self.y[:n] - self.prev_y[:n]) * alpha
+        rad = self.rad[:n]
+        left, top, right, bottom = camera.view(*surface.get_size())
+        visible = np.flatnonzero((rad > 0) & (x + rad > left) & (x - rad < right) & (y + rad > top) & (y - rad < bottom))
+        if not visible.size:
+            return
+        corners = self.orientation[visible, None] + _CORNERS
+        points = np.stack((x[visible, None] + rad[visible, None] * np.cos(corners) - camera.x,
+                           y[visible, None] + rad[visible, None] * np.sin(corners) - camera.y), axis=-1) * camera.zoom
+        opacity = DEATH_OPACITY + (1 - DEATH_OPACITY) * self.lifespan[visible] / DEBRIS_LIFESPAN
+        background = np.array(constants.BACKGROUND_COLOR, dtype=np.float64)
+        colors = (background + (self.color[visible] - background) * opacity[:, None]).astype(np.uint8)
+        for color, triangle in zip(colors.tolist(), points.tolist()):
+            pygame.draw.polygon(surface, color, triangle)
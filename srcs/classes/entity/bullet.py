@@ -1,23 +1,45 @@
-from __future__ import annotations
-import random
-
-from srcs.classes.entity.faction_particle import FactionParticle
-from srcs.classes.faction_data import FactionData
-from srcs.constants import *
-
-
-# Bullet class
-class Bullet(FactionParticle):
-    def __init__(self, faction: FactionData, x: float=0.0, y: float=0.0, angle: float=0.0, speed=BULLET_SPEED, radius=BULLET_RADIUS,
-                 color=BULLET_COLOR, hp=1.0, dmg=1.0, lifespan=float('inf'), **kwargs):
-        super().__init__(faction, x, y, angle, speed, radius, color, hp, dmg, **kwargs)
-        assert not isinstance(lifespan, tuple)
-        self.lifespan = lifespan
-
-    def move(self):
-        super().move()
-        self.lifespan -= 1
-
-    def is_dead(self):
-        return super().is_dead() or self.x < 0 or self.x > MAP_WIDTH or\
-            self.y < 0 or self.y > MAP_HEIGHT or self.lifespan <= 0
\ No newline at end of file
+from __future__ import annotations
+import random
+
+from srcs.classes.entity.faction_particle import FactionParticle
+from srcs.classes.entity.projectile_pool import PooledParticle, ProjectilePool, COLUMNS, add_pooled_columns
+from srcs.classes.entity.recyclable import Recyclable
+from srcs.classes.faction_data import FactionData
+from srcs.constants import *
+
+
+# Bullet class
+class Bullet(Recyclable, PooledParticle, FactionParticle):
+    __slots__ = ()
+
+    def __init__(self, faction: FactionData, x: float=0.0, y: float=0.0, angle: float=0.0, speed=BULLET_SPEED, radius=BULLET_RADIUS,
+                 color=BULLET_COLOR, hp=1.0, dmg=1.0, lifespan=float('inf'), **kwargs):
+        super().__init__(faction, x, y, angle, speed, radius, color, hp, dmg, **kwargs)
+        assert not isinstance(lifespan, tuple)
+        self.lifespan = lifespan
+
+    def get_pool(self) -> ProjectilePool | None:
+        if self.faction is None:
+            return None
+        return self.faction.game_data.projectiles
+
+    def get_pool_faction(self):
+        return self.faction
+
+    def move(self):
+        # once attached, the pool integrates, ages and culls it in ProjectilePool.step()
+        if self._pool is not None:
+            return
+        super().move()
+        self.lifespan -= 1
+        self.attach_to_pool()
+
+    def on_death(self):
+        self.detach_from_pool()
+        return super().on_death()
+
+    def is_dead(self):
+        return super().is_dead() or self.is_culled()
+
+
+add_pooled_columns(Bullet, COLUMNS)
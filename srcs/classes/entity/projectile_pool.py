@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import collections
+import operator
+import types
+
+import numpy as np
+
+from srcs.constants import MAP_WIDTH, MAP_HEIGHT
+
+COLUMNS = ("x", "y", "prev_x", "prev_y", "xv", "yv", "rad", "hp", "max_hp", "regen_rate", "lifespan")
+NO_FACTION = -1
+# the slot each pooled column is stored in on the particles, filled by add_pooled_columns()
+_column_slots: dict[str, types.MemberDescriptorType] = {}
+
+
+class ProjectilePool:
+    """
+    Struct-of-arrays store for short-lived particles (bullets, missiles, lazers, debris, water).
+
+    Every column is a dense NumPy array, slots [0, size) are alive. step() integrates, ages and
+    bounds-culls all of them in a few vector operations. The particles are handles into their slot:
+    writes go through to the arrays (see PooledParticle), and step() writes what it changed back
+    to the handles' own slots so reads stay plain attribute reads.
+    """
+
+    def __init__(self, capacity: int = 256, columns: tuple[str, ...] = COLUMNS):
+        """:param columns: COLUMNS, optionally followed by more for a pool of one particle type, see add_pooled_columns()"""
+        assert columns[:len(COLUMNS)] == COLUMNS
+        self.columns: tuple[str, ...] = columns
+        self.size: int = 0
+        self.capacity: int = 0
+        self.handles: list[PooledParticle] = []
+        self._read_columns = operator.attrgetter(*columns)
+        self.faction_ids: dict[object, int] = {}
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int):
+        size = self.size
+        for name in self.columns + ("faction", "culled", "padded"):
+            if name == "faction":
+                column = np.full(capacity, NO_FACTION, dtype=np.int8)
+            elif name in ("culled", "padded"):
+                column = np.zeros(capacity, dtype=np.bool_)
+            else:
+                column = np.zeros(capacity, dtype=np.float64)
+            if self.capacity:
+                column[:size] = getattr(self, name)[:size]
+            setattr(self, name, column)
+        self.capacity = capacity
+        # writing a Python float through a memoryview is much cheaper than ndarray.__setitem__
+        self.views: list[memoryview] = [memoryview(getattr(self, name)) for name in self.columns]
+
+    def __len__(self):
+        return self.size
+
+    def get_faction_id(self, faction) -> int:
+        if faction is None:
+            return NO_FACTION
+        if faction not in self.faction_ids:
+            self.faction_ids[faction] = len(self.faction_ids)
+        return self.faction_ids[faction]
+
+    def attach(self, handle: PooledParticle):
+        """Copy the handle into a new slot, its writes go to the slot from now on"""
+        if handle._pool is not None:
+            return
+        if self.size == self.capacity:
+            self._allocate(self.capacity * 2)
+        slot = self.size
+        for view, value in zip(self.views, self._read_columns(handle)):
+            view[slot] = float(value)
+        self.faction[slot] = self.get_faction_id(handle.get_pool_faction())
+        self.padded[slot] = handle.pool_padded
+        self.culled[slot] = handle._culled = handle.is_culled()
+        self.handles.append(handle)
+        self.size += 1
+        handle._pool = self
+        handle._slot = slot
+
+    def detach(self, handle: PooledParticle):
+        """Free the handle's slot by moving the last slot into it, the handle keeps its last values"""
+        if handle._pool is not self:
+            return
+        slot = handle._slot
+        handle._pool = None
+        handle._slot = -1
+
+        last = self.size - 1
+        if slot != last:
+            for name in self.columns + ("faction", "culled", "padded"):
+                column = getattr(self, name)
+                column[slot] = column[last]
+            moved = self.handles[last]
+            moved._slot = slot
+            self.handles[slot] = moved
+        self.handles.pop()
+        self.size = last
+
+    def clear(self):
+        for handle in self.handles:
+            handle._pool = None
+            handle._slot = -1
+        self.handles.clear()
+        self.size = 0
+
+    def step(self, write_back: bool = True, count: int | None = None):
+        """
+        What Particle.move, GameParticle.move and Bullet.move did one at a time, for every slot at once
+
+        :param write_back: False leaves the handles stale, for a caller that changes more columns and
+                           calls write_back() itself afterwards
+        :param count: only step the first count slots; attach() only appends, so slots attached since
+                      the pool had count of them are left alone
+        """
+        n = self.size if count is None else count
+        if not n:
+            return
+        x, y = self.x[:n], self.y[:n]
+        prev_x, prev_y = self.prev_x[:n], self.prev_y[:n]
+        prev_x[:] = x
+        prev_y[:] = y
+        x += self.xv[:n]
+        y += self.yv[:n]
+        lifespan = self.lifespan[:n]
+        lifespan -= 1
+        # pooled particles don't tick passive score, it is never read from a projectile
+        regenerating = np.flatnonzero(self.regen_rate[:n])
+        if regenerating.size:
+            self.hp[regenerating] = np.minimum(self.max_hp[regenerating],
+                                               self.hp[regenerating] + self.regen_rate[regenerating])
+
+        # effects only die once fully off the map, bullets as soon as their center leaves it
+        pad = np.where(self.padded[:n], self.rad[:n], 0.0)
+        culled = self.culled[:n]
+        culled[:] = ((x + pad < 0) | (x - pad > MAP_WIDTH) | (y + pad < 0) | (y - pad > MAP_HEIGHT)
+                     | (lifespan <= 0))
+        if not write_back:
+            return
+
+        self.write_back(("x", "y", "prev_x", "prev_y", "lifespan"))
+        handles = self.handles
+        _set_all(_column_slots["hp"], [handles[slot] for slot in regenerating.tolist()],
+                 self.hp[regenerating].tolist())
+
+    def write_back(self, names: tuple[str, ...]):
+        """Copy columns changed directly in the arrays, and the culled flags, back to every handle"""
+        n = self.size
+        # a pass per column beats building one row per handle
+        for name in names:
+            _set_all(_column_slots[name], self.handles, getattr(self, name)[:n].tolist())
+        _set_all(_column_slots["_culled"], self.handles, self.culled[:n].tolist())
+
+
+def _set_all(slot: types.MemberDescriptorType, handles: list, values: list):
+    """Set the slot straight, skipping PooledParticle.__setattr__ and its write-through to where the values came from"""
+    collections.deque(map(slot.__set__, handles, values), maxlen=0)
+
+
+class PooledParticle:
+    """
+    Mixin for particles that can live in a ProjectilePool.
+
+    Subclasses attach on their first move() through attach_to_pool() and detach in on_death().
+    A mixin can't hold slots next to the particle's own: _pool, _slot and _culled are GameParticle's,
+    and every subclass calls add_pooled_columns() itself.
+    """
+    __slots__ = ()
+    pool_padded: bool = False
+    # column name -> index into the pool's views, see add_pooled_columns()
+    _pooled_columns: dict[str, int] = {}
+
+    def __init__(self, *args, **kwargs):
+        # before the particle's __init__, its writes to the columns check _pool
+        self._pool: ProjectilePool | None = None
+        self._slot: int = -1
+        self._culled: bool = False
+        super().__init__(*args, **kwargs)
+
+    def __setattr__(self, name, value):
+        # reads stay plain slot reads, only writes to a column pay for the write-through
+        object.__setattr__(self, name, value)
+        index = self._pooled_columns.get(name)
+        if index is not None:
+            pool = self._pool
+            if pool is not None:
+                pool.views[index][self._slot] = float(value)
+
+    def get_pool(self) -> ProjectilePool | None:
+        return None
+
+    def get_pool_faction(self):
+        return None
+
+    def is_pooled(self) -> bool:
+        return self._pool is not None
+
+    def attach_to_pool(self):
+        pool = self.get_pool()
+        if pool is not None:
+            pool.attach(self)
+
+    def detach_from_pool(self):
+        if self._pool is not None:
+            self._pool.detach(self)
+
+    def is_culled(self) -> bool:
+        """Out of the map or out of lifespan, as of the last ProjectilePool.step() while attached"""
+        if self._pool is not None:
+            return self._culled
+        pad = self.rad if self.pool_padded else 0.0
+        return (self.x + pad < 0 or self.x - pad > MAP_WIDTH or
+                self.y + pad < 0 or self.y - pad > MAP_HEIGHT or self.lifespan <= 0)
+
+
+def add_pooled_columns(cls: type, columns: tuple[str, ...]):
+    """
+    Make writes to cls's attributes named in columns go through to the pool, columns as given to its ProjectilePool.
+    Each column must be a slot of cls, and the same slot for every class sharing a pool.
+    """
+    for name in columns + ("_culled",):
+        slot = _column_slots.setdefault(name, getattr(cls, name))
+        assert isinstance(slot, types.MemberDescriptorType) and getattr(cls, name) is slot, \
+            f"{cls.__name__}.{name} is not the slot the pool writes back to"
+    cls._pooled_columns = {name: index for index, name in enumerate(columns)}
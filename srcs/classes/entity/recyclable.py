@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from srcs.constants import RECYCLE_LIMIT
+
+
+class Recyclable:
+    """
+    Free list per class, for particles created and thrown away by the hundreds (bullets,
+    effects, water). release() hands a dead particle back, acquire() returns one reset by its own
+    __init__, the same way a new one would be built, instead of allocating another one.
+
+    Released particles only become reusable at the next reuse_released(), see there.
+    """
+    __slots__ = ()
+    # None until the class is acquire()d once, so classes nobody reuses don't hold on to their dead
+    _free_list: list[Recyclable] | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # acquire() must hand back exactly the class asked for
+        cls._free_list = None
+
+    @classmethod
+    def acquire(cls, *args, **kwargs):
+        """Same arguments as the class itself"""
+        if cls._free_list is None:
+            cls._free_list = []
+        if not cls._free_list:
+            return cls(*args, **kwargs)
+        particle = cls._free_list.pop()
+        particle.__init__(*args, **kwargs)
+        return particle
+
+    def release(self):
+        """Once it is out of every list"""
+        _released.append(self)
+
+
+# released since the last reuse_released()
+_released: list[Recyclable] = []
+
+
+def reuse_released():
+    """
+    Move the particles released since the last call to their free lists. Called once a tick, so a
+    particle sits out at least a whole tick before it is reused: whatever still pointed at it (a
+    unit's or a missile's target) has checked it once against a dead particle and moved on by then,
+    instead of following it into its next life.
+    """
+    for particle in _released:
+        free_list = type(particle)._free_list
+        if free_list is not None and len(free_list) < RECYCLE_LIMIT:
+            # don't keep what it belonged to alive while it waits
+            particle.parent = None
+            free_list.append(particle)
+    _released.clear()
+
+
+def recycle(particle):
+    """For utils.remove_dead(): release the particles that can be reused"""
+    if isinstance(particle, Recyclable):
+        particle.release()
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import csv
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class FrameProfiler:
+    """
+    Times the phases of each frame in milliseconds.
+
+    Keeps a rolling window per phase for the debug HUD (mean, p95, max) and
+    optionally writes one CSV row per frame.
+    """
+
+    def __init__(self, phases: list[str], window: int = 120, csv_path: str | None = None):
+        self.phases: list[str] = list(phases)
+        self.window: int = window
+        self.history: dict[str, deque[float]] = {name: deque(maxlen=window) for name in self.phases + ["frame"]}
+        self.frame_index: int = 0
+        self._current: dict[str, float] = {}
+        self._frame_start: float = time.perf_counter()
+        self._csv_file = None
+        self._csv_writer = None
+        if csv_path is not None:
+            self._csv_file = open(csv_path, "w", newline="")
+            self._csv_writer = csv.writer(self._csv_file)
+            self._csv_writer.writerow(["frame"] + [f"{name}_ms" for name in self.phases] + ["frame_ms"])
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            self._current[name] = self._current.get(name, 0.0) + elapsed
+
+    def start_frame(self):
+        self._current = {}
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self) -> dict[str, float]:
+        """Close the current frame, returns its timings in ms keyed by phase (and "frame" for the total)."""
+        row = {name: self._current.get(name, 0.0) for name in self.phases}
+        row["frame"] = (time.perf_counter() - self._frame_start) * 1000
+        for name, value in row.items():
+            self.history[name].append(value)
+        if self._csv_writer is not None:
+            self._csv_writer.writerow([self.frame_index] + [f"{row[name]:.3f}" for name in self.phases]
+                                      + [f"{row['frame']:.3f}"])
+        self.frame_index += 1
+        self._current = {}
+        return row
+
+    def get_stats(self, name: str) -> tuple[float, float, float]:
+        """:return: (mean, p95, max) over the rolling window, in ms"""
+        values = sorted(self.history[name])
+        if not values:
+            return 0.0, 0.0, 0.0
+        p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+        return sum(values) / len(values), p95, values[-1]
+
+    def get_report_lines(self) -> list[str]:
+        lines = [f"{'phase (ms)':16}{'mean':>7}{'p95':>7}{'max':>7}"]
+        for name in self.phases + ["frame"]:
+            mean, p95, peak = self.get_stats(name)
+            lines.append(f"{name:16}{mean:7.2f}{p95:7.2f}{peak:7.2f}")
+        return lines
+
+    def close(self):
+        if self._csv_file is not None:
+            self._csv_file.close()
+            self._csv_file = None
+            self._csv_writer = None
@@ -0,0 +1,29 @@
+import pygame
+
+from srcs.constants import FPS
+
+
+class WallClock:
+    """Game time in milliseconds, read from pygame's real-time timer."""
+
+    def now(self) -> float:
+        return pygame.time.get_ticks()
+
+    def advance(self) -> float:
+        """Called once per Game.update(); returns the new game time."""
+        return self.now()
+
+
+class FixedStepClock(WallClock):
+    """Game time that moves forward by a fixed step per tick, independent of real time."""
+
+    def __init__(self, step_ms: float = 1000 / FPS, start_ms: float = 0.0):
+        self.step_ms: float = step_ms
+        self.time: float = start_ms
+
+    def now(self) -> float:
+        return self.time
+
+    def advance(self) -> float:
+        self.time += self.step_ms
+        return self.time
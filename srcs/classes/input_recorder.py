@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import json
+from typing import Iterator
+
+import pygame
+
+from srcs import constants
+
+# the events Game.handle_event() reacts to, and the attributes it reads from them
+RECORDED_EVENT_TYPES = (pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+RECORDED_ATTRIBUTES = ("key", "button", "pos")
+
+
+def serialize_event(event: pygame.event.Event) -> dict:
+    data = {"type": event.type}
+    for name in RECORDED_ATTRIBUTES:
+        if hasattr(event, name):
+            value = getattr(event, name)
+            data[name] = list(value) if isinstance(value, tuple) else value
+    return data
+
+
+def deserialize_event(data: dict) -> pygame.event.Event:
+    attributes = {name: tuple(value) if isinstance(value, list) else value
+                  for name, value in data.items() if name != "type"}
+    return pygame.event.Event(data["type"], attributes)
+
+
+class InputRecorder:
+    """
+    Records the player's input once per simulation tick: the events handled since the previous tick
+    and the mouse position the tick ran with. Saved together with the game's seed, it is everything
+    InputReplay needs to play the same game again.
+    """
+
+    def __init__(self, seed: int):
+        self.seed: int = seed
+        self.ticks: list[dict] = []
+        self._pending_events: list[dict] = []
+
+    def record_event(self, event: pygame.event.Event):
+        if event.type in RECORDED_EVENT_TYPES:
+            self._pending_events.append(serialize_event(event))
+
+    def record_tick(self, mouse_pos: tuple[int, int]):
+        tick = {"mouse": list(mouse_pos)}
+        if self._pending_events:
+            tick["events"] = self._pending_events
+            self._pending_events = []
+        self.ticks.append(tick)
+
+    def save(self, path: str):
+        with open(path, "w") as f:
+            json.dump({"seed": self.seed, "fps": constants.FPS, "ticks": self.ticks}, f)
+
+
+class InputReplay:
+    """A recording loaded back, iterates (events, mouse position) once per recorded tick."""
+
+    def __init__(self, seed: int, ticks: list[dict], fps: int = constants.FPS):
+        self.seed: int = seed
+        self.ticks: list[dict] = ticks
+        self.fps: int = fps
+
+    @classmethod
+    def load(cls, path: str) -> InputReplay:
+        with open(path) as f:
+            data = json.load(f)
+        if data.get("fps", constants.FPS) != constants.FPS:
+            raise ValueError(f"{path} was recorded at {data['fps']} ticks per second, the game runs at {constants.FPS}")
+        return cls(data["seed"], data["ticks"], data.get("fps", constants.FPS))
+
+    def __len__(self):
+        return len(self.ticks)
+
+    def __iter__(self) -> Iterator[tuple[list[pygame.event.Event], tuple[int, int]]]:
+        for tick in self.ticks:
+            yield [deserialize_event(event) for event in tick.get("events", ())], tuple(tick["mouse"])
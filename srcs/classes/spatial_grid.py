@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+from srcs.classes.entity.game_particle import GameParticle
+from srcs.constants import MAP_WIDTH, MAP_HEIGHT, COLLISION_CELL_SIZE
+
+
+class SpatialGrid:
+    """
+    Uniform grid over the map, rebuilt once per frame and shared by every collision pass.
+
+    Each particle is inserted into every cell its collision box (x, y +- get_collision_rad())
+    overlaps, clamped to the map. Segments (lazers) are inserted into the cells along
+    prev_x/prev_y -> end_x/end_y instead, widened by their rad, since their collision rad is the
+    whole beam length. candidate_pairs() returns each pair of particles sharing at least one
+    cell exactly once, so the cost follows local density instead of list length.
+    """
+
+    def __init__(self, cell_size: float = COLLISION_CELL_SIZE):
+        self.cell_size: float = cell_size
+        self.cols: int = int(np.ceil(MAP_WIDTH / cell_size))
+        self.rows: int = int(np.ceil(MAP_HEIGHT / cell_size))
+        self.particles: Sequence[GameParticle] = []
+        self.x: np.ndarray = np.empty(0)
+        self.y: np.ndarray = np.empty(0)
+        self.rad: np.ndarray = np.empty(0)
+        self.is_segment: np.ndarray = np.empty(0, dtype=bool)
+        # (cell, particle index) entries sorted by cell
+        self.entry_cells: np.ndarray = np.empty(0, dtype=np.int64)
+        self.entry_particles: np.ndarray = np.empty(0, dtype=np.int64)
+
+    def rebuild(self, particles: Sequence[GameParticle], is_segment: np.ndarray | None = None,
+                skip: np.ndarray | None = None):
+        """
+        :param particles: everything that can collide this frame
+        :param is_segment: mask of the particles to insert as a segment, they need prev_x, prev_y, end_x, end_y
+        :param skip: mask of the particles not to insert at all, they keep their index but never pair
+        """
+        self.particles = particles
+        n = len(particles)
+        self.x = np.fromiter((p.x for p in particles), dtype=np.float64, count=n)
+        self.y = np.fromiter((p.y for p in particles), dtype=np.float64, count=n)
+        self.rad = np.fromiter((p.get_collision_rad() for p in particles), dtype=np.float64, count=n)
+        self.is_segment = np.zeros(n, dtype=bool) if is_segment is None else is_segment
+        if not n:
+            self.entry_cells = self.entry_particles = np.empty(0, dtype=np.int64)
+            return
+        if not self.is_segment.any() and skip is None:
+            cells, owners = self._box_entries(np.arange(n), self.x, self.y, self.rad)
+        else:
+            inserted = np.ones(n, dtype=bool) if skip is None else ~skip
+            boxes = np.flatnonzero(inserted & ~self.is_segment)
+            box_cells, box_owners = self._box_entries(boxes, self.x[boxes], self.y[boxes], self.rad[boxes])
+            seg_cells, seg_owners = self._segment_entries(np.flatnonzero(inserted & self.is_segment))
+            cells = np.concatenate((box_cells, seg_cells))
+            owners = np.concatenate((box_owners, seg_owners))
+
+        order = np.argsort(cells, kind="stable")
+        self.entry_cells = cells[order]
+        self.entry_particles = owners[order]
+
+    def _box_entries(self, indices: np.ndarray, x: np.ndarray, y: np.ndarray, half_size: np.ndarray | float)\
+            -> tuple[np.ndarray, np.ndarray]:
+        """:return: (cells, owners) for every cell overlapped by each box, owners taken from indices"""
+        x0, x1 = self._cell_range(x, half_size, self.cols)
+        y0, y1 = self._cell_range(y, half_size, self.rows)
+        width = x1 - x0 + 1
+        counts = width * (y1 - y0 + 1)
+        entry = np.repeat(np.arange(indices.size), counts)
+        local = np.arange(entry.size) - np.repeat(np.cumsum(counts) - counts, counts)
+        cells = (y0[entry] + local // width[entry]) * self.cols + x0[entry] + local % width[entry]
+        return cells, indices[entry]
+
+    def _segment_entries(self, indices: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Walk each segment in steps of half a cell; a box of rad + half a step around every sample
+        covers the segment between samples, so every cell within rad of the segment is hit.
+        Samples off the map clamp to the border cells the same way particles off the map do.
+        """
+        particles = self.particles
+        x0 = np.fromiter((particles[i].prev_x for i in indices), dtype=np.float64, count=indices.size)
+        y0 = np.fromiter((particles[i].prev_y for i in indices), dtype=np.float64, count=indices.size)
+        x1 = np.fromiter((particles[i].end_x for i in indices), dtype=np.float64, count=indices.size)
+        y1 = np.fromiter((particles[i].end_y for i in indices), dtype=np.float64, count=indices.size)
+        rad = np.fromiter((particles[i].rad for i in indices), dtype=np.float64, count=indices.size)
+
+        step = self.cell_size / 2
+        samples = np.ceil(np.hypot(x1 - x0, y1 - y0) / step).astype(np.int64) + 1
+        segment = np.repeat(np.arange(indices.size), samples)
+        t = (np.arange(segment.size) - np.repeat(np.cumsum(samples) - samples, samples)) / np.maximum(samples - 1, 1)[segment]
+        sample_x = x0[segment] + (x1 - x0)[segment] * t
+        sample_y = y0[segment] + (y1 - y0)[segment] * t
+        cells, owners = self._box_entries(indices[segment], sample_x, sample_y, rad[segment] + step / 2)
+        # neighbouring samples share most of their cells
+        keys = np.unique(owners * (self.cols * self.rows) + cells)
+        owners, cells = np.divmod(keys, self.cols * self.rows)
+        return cells, owners
+
+    def _cell_range(self, center: np.ndarray, half_size: np.ndarray | float, cell_count: int)\
+            -> tuple[np.ndarray, np.ndarray]:
+        low = np.floor((center - half_size) / self.cell_size)
+        high = np.floor((center + half_size) / self.cell_size)
+        low = np.clip(np.nan_to_num(low), 0, cell_count - 1).astype(np.int64)
+        high = np.clip(np.nan_to_num(high), 0, cell_count - 1).astype(np.int64)
+        return low, high
+
+    def candidate_pairs(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        :return: (i, j) index arrays into the particles given to rebuild(), i < j, each pair once,
+                 with overlapping collision boxes or cells
+        """
+        cells = self.entry_cells
+        if cells.size < 2:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        # every entry pairs with the entries after it in the same cell
+        boundaries = np.flatnonzero(np.diff(cells)) + 1
+        starts = np.concatenate(([0], boundaries))
+        ends = np.concatenate((boundaries, [cells.size]))
+        cell_end = np.repeat(ends, ends - starts)
+        partners = cell_end - np.arange(cells.size) - 1
+        left = np.repeat(np.arange(cells.size), partners)
+        right = left + 1 + np.arange(left.size) - np.repeat(np.cumsum(partners) - partners, partners)
+
+        a = self.entry_particles[left]
+        b = self.entry_particles[right]
+        i = np.minimum(a, b)
+        j = np.maximum(a, b)
+        # particles spanning several cells meet in more than one of them
+        keys = np.unique(i * len(self.particles) + j)
+        i, j = np.divmod(keys, len(self.particles))
+
+        reach = self.rad[i] + self.rad[j]
+        close = (np.abs(self.x[i] - self.x[j]) <= reach) & (np.abs(self.y[i] - self.y[j]) <= reach)
+        # a segment's cells already follow its beam, its collision rad around x, y would only be looser
+        close |= self.is_segment[i] | self.is_segment[j]
+        return i[close], j[close]
+
+    def query_pairs(self, x: np.ndarray, y: np.ndarray, half_size: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Candidates between boxes that are not in the grid and the particles that are. For crowds of small
+        particles that only collide with the grid's particles and not with each other (water): they are
+        never inserted, so they never pair among themselves.
+
+        :return: (q, p) index arrays into the queried boxes and into the particles given to rebuild(),
+                 each pair once, with overlapping collision boxes or cells
+        """
+        empty = np.empty(0, dtype=np.int64)
+        if not x.size or not self.entry_cells.size:
+            return empty, empty
+        cells, owners = self._box_entries(np.arange(x.size), x, y, half_size)
+        start = np.searchsorted(self.entry_cells, cells, side="left")
+        counts = np.searchsorted(self.entry_cells, cells, side="right") - start
+        q = np.repeat(owners, counts)
+        p = self.entry_particles[np.repeat(start, counts) + np.arange(q.size) - np.repeat(np.cumsum(counts) - counts, counts)]
+        keys = np.unique(q * len(self.particles) + p)
+        q, p = np.divmod(keys, len(self.particles))
+
+        reach = half_size[q] + self.rad[p]
+        close = (np.abs(x[q] - self.x[p]) <= reach) & (np.abs(y[q] - self.y[p]) <= reach)
+        close |= self.is_segment[p]
+        return q[close], p[close]
+
+    def query_rect(self, left: float, top: float, right: float, bottom: float) -> np.ndarray:
+        """
+        Visibility: only the cells under the rect are looked at, so the cost follows what is in it.
+
+        :return: indices into the particles given to rebuild(), in order, of those whose collision box
+                 overlaps the rect (segments: whose cells do)
+        """
+        if not self.entry_cells.size:
+            return np.empty(0, dtype=np.int64)
+        col0, col1 = self._cell_range(np.array([(left + right) / 2]), (right - left) / 2, self.cols)
+        row0, row1 = self._cell_range(np.array([(top + bottom) / 2]), (bottom - top) / 2, self.rows)
+        rows = np.arange(row0[0], row1[0] + 1)
+        # each row of cells under the rect is one run of the sorted entries
+        start = np.searchsorted(self.entry_cells, rows * self.cols + col0[0], side="left")
+        counts = np.searchsorted(self.entry_cells, rows * self.cols + col1[0], side="right") - start
+        entries = np.repeat(start, counts) + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        found = np.unique(self.entry_particles[entries])
+
+        x, y, rad = self.x[found], self.y[found], self.rad[found]
+        inside = (x + rad >= left) & (x - rad <= right) & (y + rad >= top) & (y - rad <= bottom)
+        return found[inside | self.is_segment[found]]
+
+
+def neighbor_pairs(x: np.ndarray, y: np.ndarray, reach: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Cell list for points: bins them into cells of size reach, so two points within reach of each other
+    on both axes sit in the same or adjacent cells. Each cell is paired with itself and with 4 of its 8
+    neighbours (right, and the 3 below), which visits every pair of cells once.
+
+    :return: (i, j) index arrays, each pair once, with |x[i] - x[j]| <= reach and |y[i] - y[j]| <= reach
+    """
+    n = x.size
+    if n < 2 or reach <= 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    cell_x = np.floor(x / reach).astype(np.int64)
+    cell_y = np.floor(y / reach).astype(np.int64)
+    # a margin of one cell on each side keeps neighbour keys from wrapping into the next row
+    cell_x -= cell_x.min() - 1
+    cell_y -= cell_y.min() - 1
+    width = int(cell_x.max()) + 2
+    keys = cell_y * width + cell_x
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+
+    lefts, rights = [], []
+    for dx, dy in ((0, 0), (1, 0), (-1, 1), (0, 1), (1, 1)):
+        target = keys + dy * width + dx
+        end = np.searchsorted(keys, target, side="right")
+        # within a cell only pair with the entries after this one
+        start = np.arange(1, n + 1) if dx == dy == 0 else np.searchsorted(keys, target, side="left")
+        counts = np.maximum(end - start, 0)
+        left = np.repeat(np.arange(n), counts)
+        rights.append(np.repeat(start, counts) + np.arange(left.size) - np.repeat(np.cumsum(counts) - counts, counts))
+        lefts.append(left)
+    i = order[np.concatenate(lefts)]
+    j = order[np.concatenate(rights)]
+    close = (np.abs(x[i] - x[j]) <= reach) & (np.abs(y[i] - y[j]) <= reach)
+    return i[close], j[close]
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import pygame
+
+from srcs.constants import SPRITE_CACHE_SIZE, SPRITE_ALPHA_STEP
+
+
+class SpriteCache:
+    """
+    See-through circles drawn once and blitted from then on, kept for the last SPRITE_CACHE_SIZE
+    (radius, color, alpha) keys used. Radii are rounded to whole pixels and alpha to steps of
+    SPRITE_ALPHA_STEP, so effects that grow and fade a little every frame keep hitting the same sprites.
+
+    Opaque circles aren't cached: pygame.draw.circle() straight on the surface is cheaper than
+    looking up and blitting any sprite.
+    """
+
+    def __init__(self, size: int = SPRITE_CACHE_SIZE):
+        self.size: int = size
+        self.hits: int = 0
+        self.misses: int = 0
+        self._sprites: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+    def __len__(self):
+        return len(self._sprites)
+
+    def __str__(self):
+        lookups = self.hits + self.misses
+        return f"{self.hits} hits, {self.misses} misses ({self.hits / lookups if lookups else 0:.0%})"
+
+    def get(self, rad: int, color: tuple[int, int, int], alpha: int) -> pygame.Surface:
+        """:return: a (2 * rad, 2 * rad) sprite of the circle, alpha per pixel"""
+        key = (rad, color, alpha)
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self.hits += 1
+            self._sprites.move_to_end(key)
+            return sprite
+        self.misses += 1
+        sprite = pygame.Surface((rad * 2, rad * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (*color, alpha), (rad, rad), rad)
+        self._sprites[key] = sprite
+        if len(self._sprites) > self.size:
+            self._sprites.popitem(last=False)
+        return sprite
+
+    def draw_circle(self, surface: pygame.Surface, color: tuple[int, int, int], center: tuple[float, float],
+                    rad: float, alpha: float = 255):
+        """Like pygame.draw.circle(surface, color, center, rad), alpha from 0 (invisible) to 255"""
+        rad = int(rad + 0.5)
+        alpha = int(alpha / SPRITE_ALPHA_STEP + 0.5) * SPRITE_ALPHA_STEP
+        if rad <= 0 or alpha <= 0:
+            return
+        x, y = int(center[0]), int(center[1])
+        if alpha >= 255:
+            pygame.draw.circle(surface, color, (x, y), rad)
+            return
+        surface.blit(self.get(rad, color, alpha), (x - rad, y - rad))
+
+
+# shared by every draw() on the map
+sprite_cache = SpriteCache()
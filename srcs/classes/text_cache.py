@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import pygame
+
+from srcs.constants import TEXT_CACHE_SIZE
+
+
+class TextCache:
+    """
+    Rendered text surfaces, kept for the last TEXT_CACHE_SIZE (font, text, color) keys used. Most HUD
+    lines and button labels are the same from one frame to the next.
+    """
+
+    def __init__(self, size: int = TEXT_CACHE_SIZE):
+        self.size: int = size
+        self.hits: int = 0
+        self.misses: int = 0
+        self._surfaces: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def __str__(self):
+        lookups = self.hits + self.misses
+        return f"{self.hits} hits, {self.misses} misses ({self.hits / lookups if lookups else 0:.0%})"
+
+    def render(self, font: pygame.font.Font, text: str, color: tuple[int, int, int]) -> pygame.Surface:
+        """font.render(text, True, color), the surface is shared and must not be drawn on"""
+        key = (font, text, color)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = font.render(text, True, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.size:
+            self._surfaces.popitem(last=False)
+        return surface
+
+
+# shared by the HUD and the UI
+text_cache = TextCache()
@@ -1,20 +1,29 @@
-from __future__ import annotations
-import math
-from srcs.constants import *
-from srcs.classes.entity.bullet import Bullet
-
-
-class WaterParticle(Bullet):
-    def __init__(self, x: float, y: float, angle, speed=3, radius=3,
-                 hp=1, dmg=0, lifespan=60 * 4):
-        super().__init__(None, x, y, angle, speed, radius, hp=hp, dmg=dmg,
-                         lifespan=lifespan)
-        self.collide_rad: float = radius / 5
-        self.mass: float = 10
-
-    def move(self):
-        super().move()
-        self.dmg = self.speed / MAX_PARTICLE_COUNT * 25
-
-    def distance_with(self, other):
-        return math.hypot(self.x - other.x, self.y - other.y)
+from __future__ import annotations
+import math
+from srcs.constants import *
+from srcs.classes.entity.bullet import Bullet
+from srcs.classes.entity.projectile_pool import COLUMNS, add_pooled_columns
+
+# WaterParticleHandler keeps these in its pool too, for its vectorized physics
+WATER_COLUMNS = COLUMNS + ("collide_rad", "mass", "dmg")
+
+
+class WaterParticle(Bullet):
+    __slots__ = ("collide_rad", "mass")
+
+    def __init__(self, x: float, y: float, angle, speed=3, radius=3,
+                 hp=1, dmg=0, lifespan=60 * 4):
+        super().__init__(None, x, y, angle, speed, radius, hp=hp, dmg=dmg,
+                         lifespan=lifespan)
+        self.collide_rad: float = radius / 5
+        self.mass: float = 10
+
+    def move(self):
+        super().move()
+        self.dmg = self.speed * WATER_DMG_SCALE
+
+    def distance_with(self, other):
+        return math.hypot(self.x - other.x, self.y - other.y)
+
+
+add_pooled_columns(WaterParticle, WATER_COLUMNS)
@@ -1,100 +1,64 @@
-from __future__ import annotations
-import math
-import random
-from srcs.classes.water_particle import WaterParticle
-
-
-def repel_particle(p1: WaterParticle, p2: WaterParticle):
-    # Vector from p1 to p2
-    dx = p2.x - p1.x
-    dy = p2.y - p1.y
-    distance = math.hypot(dy, dx)
-
-    if distance == 0:
-        dx = random.uniform(-1, 1)
-        dy = random.uniform(-1, 1)
-        distance = math.hypot(dy, dx)
-    # Calculate the overlap distance
-    overlap = p1.collide_rad + p2.collide_rad - distance
-
-    if overlap > 0:
-        # Normal vector (unit vector)
-        nx = dx / distance
-        ny = dy / distance
-
-        # Displace each particle along the normal vector by half the overlap distance
-        p1.x -= nx * overlap / 2
-        p1.y -= ny * overlap / 2
-        p2.x += nx * overlap / 2
-        p2.y += ny * overlap / 2
-
-
-def adhesive_particle(p1: WaterParticle, p2: WaterParticle, adhesive_strength=0.01, adhesion_distance=10):
-    # Calculate the difference in position
-    dx = p2.x - p1.x
-    dy = p2.y - p1.y
-
-    # Calculate the distance between the particles
-    distance = math.hypot(dx, dy)
-
-    if distance == 0:
-        return
-
-    nx = dx / distance
-    ny = dy / distance
-
-    adhesion_distance += p1.rad + p2.rad
-    if distance < adhesion_distance:
-        # Calculate the adhesive force magnitude
-        force_magnitude = adhesive_strength * (adhesion_distance - distance)
-
-        # Apply adhesive force to both particles
-        p1_force_x = force_magnitude * nx / p1.mass
-        p1_force_y = force_magnitude * ny / p1.mass
-        p2_force_x = -force_magnitude * nx / p2.mass
-        p2_force_y = -force_magnitude * ny / p2.mass
-
-        p1.xv += p1_force_x
-        p1.yv += p1_force_y
-        p2.xv += p2_force_x
-        p2.yv += p2_force_y
-
-
-def collide_particle(p1: WaterParticle, p2: WaterParticle):
-    # Calculate the difference in position and velocity
-    dx = p2.x - p1.x
-    dy = p2.y - p1.y
-    dvx = p2.xv - p1.xv
-    dvy = p2.yv - p1.yv
-
-    # Calculate the distance between the particles
-    distance = math.sqrt(dx ** 2 + dy ** 2)
-
-    if distance == 0:
-        return
-
-    # Calculate the normal vector (normalized)
-    nx = dx / distance
-    ny = dy / distance
-
-    # Calculate the relative velocity in terms of the normal direction
-    dv_dot_n = dvx * nx + dvy * ny
-
-    # Calculate the mass ratio
-    m1 = p1.mass
-    m2 = p2.mass
-
-    # Calculate the new velocities along the normal direction
-    if dv_dot_n > 0:  # They are moving away from each other, no need to collide
-        return
-
-    # Conservation of momentum and energy along the normal direction
-    # Formulae derived from the 1D elastic collision equations
-    new_v1n = (p1.xv * nx + p1.yv * ny * (m1 - m2) + 2 * m2 * (p2.xv * nx + p2.yv * ny)) / (m1 + m2)
-    new_v2n = (p2.xv * nx + p2.yv * ny * (m2 - m1) + 2 * m1 * (p1.xv * nx + p1.yv * ny)) / (m1 + m2)
-
-    # Update velocities in the normal direction
-    p1.xv += (new_v1n - (p1.xv * nx + p1.yv * ny)) * nx
-    p1.yv += (new_v1n - (p1.xv * nx + p1.yv * ny)) * ny
-    p2.xv += (new_v2n - (p2.xv * nx + p2.yv * ny)) * nx
-    p2.yv += (new_v2n - (p2.xv * nx + p2.yv * ny)) * ny
+from __future__ import annotations
+import numpy as np
+
+# Every function works on neighbour pairs (i, j) at once: the arrays are the handler's pool columns,
+# (dx, dy, distance) go from i to j, and the changes of all pairs are summed per particle.
+# The pairs must reach as far as adhesion does, the shorter-range functions filter them further.
+
+ADHESION_DISTANCE = 10
+
+
+def _sum_per_particle(n: int, i: np.ndarray, j: np.ndarray, on_i: np.ndarray, on_j: np.ndarray) -> np.ndarray:
+    return np.bincount(i, weights=on_i, minlength=n) + np.bincount(j, weights=on_j, minlength=n)
+
+
+def adhesive_particles(i, j, dx, dy, distance, rad, mass, xv, yv, adhesive_strength=0.01,
+                       adhesion_distance=ADHESION_DISTANCE):
+    """Pull pairs closer than adhesion_distance apart from their edges towards each other"""
+    reach = adhesion_distance + rad[i] + rad[j]
+    sticking = (distance > 0) & (distance < reach)
+    i, j, dx, dy, distance, reach = i[sticking], j[sticking], dx[sticking], dy[sticking], distance[sticking], reach[sticking]
+
+    force = adhesive_strength * (reach - distance) / distance
+    n = xv.size
+    xv += _sum_per_particle(n, i, j, force * dx / mass[i], -force * dx / mass[j])
+    yv += _sum_per_particle(n, i, j, force * dy / mass[i], -force * dy / mass[j])
+
+
+def collide_particles(i, j, dx, dy, distance, collide_rad, mass, xv, yv):
+    """Elastic collision along the normal for touching pairs that are moving towards each other"""
+    touching = (distance > 0) & (distance < collide_rad[i] + collide_rad[j])
+    i, j, dx, dy, distance = i[touching], j[touching], dx[touching], dy[touching], distance[touching]
+    nx = dx / distance
+    ny = dy / distance
+    v1n = xv[i] * nx + yv[i] * ny
+    v2n = xv[j] * nx + yv[j] * ny
+    # they are moving away from each other, no need to collide
+    approaching = v2n - v1n <= 0
+    i, j, nx, ny, v1n, v2n = i[approaching], j[approaching], nx[approaching], ny[approaching], v1n[approaching], v2n[approaching]
+
+    # Conservation of momentum and energy along the normal direction
+    m1 = mass[i]
+    m2 = mass[j]
+    new_v1n = (v1n * (m1 - m2) + 2 * m2 * v2n) / (m1 + m2)
+    new_v2n = (v2n * (m2 - m1) + 2 * m1 * v1n) / (m1 + m2)
+    n = xv.size
+    xv += _sum_per_particle(n, i, j, (new_v1n - v1n) * nx, (new_v2n - v2n) * nx)
+    yv += _sum_per_particle(n, i, j, (new_v1n - v1n) * ny, (new_v2n - v2n) * ny)
+
+
+def repel_particles(i, j, dx, dy, distance, collide_rad, x, y, rng: np.random.Generator):
+    """Push overlapping pairs apart, each by half the overlap; pairs on the same spot part in a random direction"""
+    overlapping = distance < collide_rad[i] + collide_rad[j]
+    i, j, dx, dy, distance = i[overlapping], j[overlapping], dx[overlapping], dy[overlapping], distance[overlapping]
+    same_spot = np.flatnonzero(distance == 0)
+    if same_spot.size:
+        dx, dy = dx.copy(), dy.copy()
+        dx[same_spot] = rng.uniform(-1, 1, same_spot.size)
+        dy[same_spot] = rng.uniform(-1, 1, same_spot.size)
+        distance = np.hypot(dx, dy)
+
+    half_overlap = (collide_rad[i] + collide_rad[j] - distance) / distance / 2
+    n = x.size
+    x += _sum_per_particle(n, i, j, -dx * half_overlap, dx * half_overlap)
+    y += _sum_per_particle(n, i, j, -dy * half_overlap, dy * half_overlap)
@@ -1,203 +1,316 @@
-from __future__ import annotations
-import math
-import random
-import pygame
-import numpy as np
-from srcs.classes.bullet_enemy_collider import collide_enemy_and_bullets
-from srcs.classes.water_particle import WaterParticle
-from srcs.classes import water_particle_collider
-from srcs import constants
-
-
-class WaterParticleHandler:
-    def __init__(self, particles=None):
-        if particles is None:
-            particles = []
-        self.particles: list[WaterParticle] = particles
-        self.orbit_max_speed: float = 0.0
-        self.orbit_acceleration: float = 0.0
-        self.orbited_particle: [WaterParticle, None] = None
-
-    def _draw_good_graphics(self, surface: pygame.Surface, focus: tuple[int, int]):
-        draw_surface = pygame.Surface((constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT), pygame.SRCALPHA)
-        draw_surface.fill((0, 0, 0, 0))  # white background
-
-        for particle in self.particles:
-            particle_surface = pygame.Surface((particle.rad * 10, particle.rad * 10), pygame.SRCALPHA)
-            particle_surface.fill((0, 0, 0, 0))
-            color = (0, 255, 255, 25)
-            pygame.draw.circle(particle_surface, color, (particle.rad, particle.rad), particle.rad)
-            draw_surface.blit(
-                particle_surface,
-                (int(particle.x - focus[0] - particle.rad), int(particle.y - focus[1] - particle.rad))
-            )
-        # overlap = black
-        alpha_array = pygame.surfarray.pixels_alpha(draw_surface)
-        # if alpha is 0, alpha = 0, else alpha = ......
-        alpha_array[:] = np.where(alpha_array == 0, 0, (355 - alpha_array) / 255 * 128)
-        del alpha_array
-
-        surface.blit(draw_surface, (focus[0], focus[1]))
-
-    def draw_everything(self, surface: pygame.Surface, focus: tuple[int, int]):
-        if constants.GOOD_GRAPHICS:
-            return self._draw_good_graphics(surface, focus)
-        k = min(1, max(0, self.particles.__len__() / constants.MAX_PARTICLE_COUNT - 1))
-        color = (25 * (1 - k), 5 + 20 * k, 50 * k, 25)
-        # color = (50 * k, 5 + 20 * (1 - k), 25 * (1 - k), 25)
-        prev_rad = None
-        particle_surface = None
-        for particle in self.particles:
-            if particle.rad != prev_rad:
-                prev_rad = particle.rad
-                particle_surface = pygame.Surface((particle.rad * 2, particle.rad * 2), pygame.SRCALPHA)
-                particle_surface.fill((0, 0, 0, 0))
-                pygame.draw.circle(particle_surface, color, (particle.rad, particle.rad), particle.rad)
-            surface.blit(particle_surface, (particle.x - particle.rad, particle.y - particle.rad),
-                         special_flags=pygame.BLEND_RGBA_ADD)
-        # if self.orbited_particle:
-        #     pygame.draw.circle(surface, (255, 255, 255),
-        #                        (self.orbited_particle.x, self.orbited_particle.y), 10)
-
-    def _collide_with_all_other(self, p1: WaterParticle, idx: int):
-        for p2 in self.particles[idx + 1:]:
-            if p2.x - p2.collide_rad > p1.x + p1.collide_rad:
-                return
-            distance = p1.distance_with(p2)
-            water_particle_collider.adhesive_particle(p1, p2)
-            if distance < p1.collide_rad + p2.collide_rad:
-                water_particle_collider.collide_particle(p1, p2)
-                water_particle_collider.repel_particle(p1, p2)
-
-    def _collide_everything(self):
-        self.particles.sort(key=lambda p: p.x - p.collide_rad)
-        for idx, p1 in enumerate(self.particles):
-            self._collide_with_all_other(p1, idx)
-
-    def _spawn_at(self, x, y):
-        random_angle = random.uniform(-math.pi, math.pi)
-        self.particles.append(WaterParticle(x, y, random_angle, radius=15, lifespan=random.randint(10, 60)))
-
-    def spawn_at(self, x, y):
-        if len(self.particles) > constants.MAX_PARTICLE_COUNT:
-            return
-        self._spawn_at(x, y)
-
-    def _move(self):
-        if self.orbited_particle and self.orbited_particle.lifespan < 0:
-            self.orbited_particle = None
-        if self.orbited_particle:
-            power = self.orbited_particle.lifespan / 480
-            radius = power * 300 + 200
-            orbit_strength = 1
-            self._attract_to(self.orbited_particle.x, self.orbited_particle.y,
-                             radius, orbit_strength)
-            ACCELERATION = 1.0
-            if self.orbited_particle.speed < self.orbit_max_speed:
-                self.orbited_particle.speed += ACCELERATION
-            for p in self.particles:
-                p.x += self.orbited_particle.xv
-                p.y += self.orbited_particle.yv
-            self.orbited_particle.move()
-        for p in self.particles:
-            p.move()
-
-    def _attract_to(self, x, y, radius, factor):
-        for p in self.particles:
-            dy = y - p.y
-            dx = x - p.x
-            dis = math.hypot(dy, dx)
-            if dis > radius or dis == 0:
-                continue
-            dy /= dis
-            dx /= dis
-            if self.orbited_particle and self.orbit_acceleration:
-                p.speed += self.orbit_acceleration
-            p.xv += dx * factor
-            p.yv += dy * factor
-            p.lifespan = random.randint(10, 30)
-
-    def attract_to(self, x, y, radius=300, factor=1):
-        self.orbited_particle = None
-        self._attract_to(x, y, radius, factor)
-
-    def collide_with_enemies(self, enemies):
-        collide_enemy_and_bullets(self.particles, enemies)
-
-    def remove_out_of_bounds(self, x_min, y_min, x_max, y_max):
-        self.particles = list(filter(
-            lambda p: x_min < p.x < x_max and y_min < p.y < y_max,
-            self.particles
-        ))
-
-    def remove_zero_lifespan(self):
-        self.particles = list(filter(
-            lambda p: p.lifespan > 0,
-            self.particles
-        ))
-
-    def remove_zero_hp(self):
-        self.particles = list(filter(
-            lambda p: not p.is_dead(),
-            self.particles
-        ))
-
-    def clear(self):
-        self.particles = []
-
-    def update(self):
-        self._move()
-        self._collide_everything()
-        if not self.particles:
-            self.orbited_particle = None
-
-        if isinstance(self.orbited_particle, WaterParticle) and self.orbited_particle.speed == 0\
-                and self.orbit_acceleration and self.particles.__len__() < constants.MAX_PARTICLE_COUNT * 2:
-            for _ in range(15):
-                self._spawn_at(self.orbited_particle.x, self.orbited_particle.y)
-
-    def release(self, mx, my, angle, speed, player):
-        if not self.particles:
-            return
-        px = sum(p.x for p in self.particles) / len(self.particles)
-        py = sum(p.y for p in self.particles) / len(self.particles)
-        particle_mouse_dis = math.hypot(mx - px, my - py)
-        mouse_player_dis = math.hypot(player.x - mx, player.y - my)
-        pxv = sum(p.xv for p in self.particles) / len(self.particles) - player.xv
-        pyv = sum(p.yv for p in self.particles) / len(self.particles) - player.yv
-        particle_velocity = math.hypot(pxv, pyv)
-        particle_speed = sum(p.speed for p in self.particles) / len(self.particles)
-        directed_constant = particle_mouse_dis + particle_velocity * 10 - len(self.particles) / 100
-        lifespan = 480
-        self.orbit_max_speed = min(particle_mouse_dis * 0.1, max(p.speed for p in self.particles) * 2)
-        # if particle_speed > 5:
-        #     self.orbit_acceleration = particle_speed / 10
-        # else:
-        self.orbit_acceleration = 0.0
-        if directed_constant > 50.0:
-            particle_velocity = particle_mouse_dis * 0.005
-            angle = math.atan2(my - py, mx - px)
-        else:
-            particle_velocity = 0
-            self.orbit_max_speed = 0
-            if particle_speed > 5:
-                self.orbit_acceleration = particle_speed / 10
-        self.orbited_particle = WaterParticle(px, py, angle, particle_velocity, lifespan=lifespan)
-
-
-def main():
-    particles = [
-        WaterParticle(0, 0, 0, radius=30),  # --->
-        WaterParticle(50, 0, math.pi, radius=30),  # <---
-        WaterParticle(1000, 0, -math.pi / 2, radius=30),  # down
-        WaterParticle(1000, 50, math.pi / 2, radius=30)  # up
-    ]
-    handler = WaterParticleHandler(particles)
-    handler._collide_everything()
-
-    for p in particles:
-        print(f'Particle at ({p.x}, {p.y}) with velocity ({p.xv}, {p.yv})')
-
-
-if __name__ == '__main__':
-    main()
+from __future__ import annotations
+import math
+import random
+import pygame
+import numpy as np
+from srcs.classes.water_particle import WaterParticle, WATER_COLUMNS
+from srcs.classes.entity.projectile_pool import ProjectilePool
+from srcs.classes.spatial_grid import neighbor_pairs
+from srcs.classes import water_particle_collider
+from srcs import constants
+
+
+class WaterParticleHandler:
+    """
+    Water particles live in their own pool: moving, attraction and the pair physics all work on its
+    arrays, neighbour pairs come from a cell list, and the particles are only written back once per update.
+    """
+
+    def __init__(self, particles=None, rng: random.Random | None = None):
+        if particles is None:
+            particles = []
+        self.rng: random.Random = rng if rng is not None else random.Random()
+        # the vectorized physics draws from numpy, seeded from rng so the game stays reproducible
+        self.np_rng: np.random.Generator = np.random.default_rng(self.rng.getrandbits(64))
+        self.pool: ProjectilePool = ProjectilePool(columns=WATER_COLUMNS)
+        for particle in particles:
+            self.pool.attach(particle)
+        # in slot order, the pool adds and removes them
+        self.particles: list[WaterParticle] = self.pool.handles
+        # spawn_at stops past it, an orbited blob grows to twice it
+        self.particle_budget: int = constants.MAX_PARTICLE_COUNT
+        self.orbit_max_speed: float = 0.0
+        self.orbit_acceleration: float = 0.0
+        self.orbited_particle: [WaterParticle, None] = None
+        # one opaque disc per radius in the current color, blitted additively
+        self._stamp_color: tuple[int, int, int] = (0, 0, 0)
+        self._stamps: dict[int, pygame.Surface] = {}
+
+    def _screen_boxes(self, focus: tuple[float, float], zoom: float, alpha: float)\
+            -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        :param alpha: how far between the last two ticks to draw, like Game.draw_everything
+        :return: (left, top, rad) of every particle's (2 * rad, 2 * rad) box on the screen, in whole pixels
+        """
+        pool = self.pool
+        n = len(pool)
+        rad = pool.rad[:n] * zoom
+        x = (pool.prev_x[:n] + (pool.x[:n] - pool.prev_x[:n]) * alpha - focus[0]) * zoom - rad
+        y = (pool.prev_y[:n] + (pool.y[:n] - pool.prev_y[:n]) * alpha - focus[1]) * zoom - rad
+        return np.floor(x).astype(np.int64), np.floor(y).astype(np.int64), np.rint(rad).astype(np.int64)
+
+    def _draw_good_graphics(self, surface: pygame.Surface, focus: tuple[float, float], zoom: float, alpha: float):
+        """
+        Metaballs: every particle adds a gaussian of height 1 to a density field at 1 / WATER_FIELD_DOWNSCALE
+        of the surface's resolution, the field is thresholded where a lone particle's edge would be and
+        smoothly scaled up. Splatting is one bincount and the blur a separable convolution over the
+        field, so the cost follows the surface size, not the particle count.
+        """
+        scale = constants.WATER_FIELD_DOWNSCALE
+        width, height = surface.get_size()
+        field_width, field_height = -(-width // scale), -(-height // scale)
+        left, top, rad = self._screen_boxes(focus, zoom, alpha)
+        if not rad.size or not rad.max():
+            return
+        sigma = max(float(rad.mean()) / scale / 2, 0.5)
+        reach = int(np.ceil(sigma * 3))
+        # the field has a margin of reach on every side, particles in it still reach into the surface
+        x = (left + rad) / scale + reach
+        y = (top + rad) / scale + reach
+        padded_width, padded_height = field_width + 2 * reach, field_height + 2 * reach
+        inside = (x >= 0) & (x < padded_width - 1) & (y >= 0) & (y < padded_height - 1)
+        x, y = x[inside], y[inside]
+        if not x.size:
+            return
+
+        # bilinear splat, so the blobs move smoothly between field pixels
+        cell_x, cell_y = np.floor(x).astype(np.int64), np.floor(y).astype(np.int64)
+        fx, fy = x - cell_x, y - cell_y
+        cells = cell_y * padded_width + cell_x
+        field = (np.bincount(cells, (1 - fx) * (1 - fy), padded_width * padded_height)
+                 + np.bincount(cells + 1, fx * (1 - fy), padded_width * padded_height)
+                 + np.bincount(cells + padded_width, (1 - fx) * fy, padded_width * padded_height)
+                 + np.bincount(cells + padded_width + 1, fx * fy, padded_width * padded_height))
+        field = field.reshape(padded_height, padded_width).astype(np.float32)
+
+        kernel = np.exp(-np.arange(-reach, reach + 1) ** 2 / (2 * sigma ** 2)).astype(np.float32)
+        rows = np.zeros((padded_height, field_width), dtype=np.float32)
+        for offset, weight in enumerate(kernel.tolist()):
+            rows += weight * field[:, offset:offset + field_width]
+        density = np.zeros((field_height, field_width), dtype=np.float32)
+        for offset, weight in enumerate(kernel.tolist()):
+            density += weight * rows[offset:offset + field_height]
+
+        # a lone particle's gaussian drops to this at its rad
+        threshold = np.exp(-(rad.mean() / scale) ** 2 / (2 * sigma ** 2))
+        # like stacking particles of alpha 25: the more overlap, the more see-through
+        stacked = 255 * (1 - 0.902 ** density)
+        lit = density >= threshold
+        lit_rows, lit_cols = np.flatnonzero(lit.any(axis=1)), np.flatnonzero(lit.any(axis=0))
+        if not lit_rows.size:
+            return
+        # only scale up the lit part, one pixel wider on each side for the edges to fade out
+        row0, row1 = max(0, lit_rows[0] - 1), min(field_height, lit_rows[-1] + 2)
+        col0, col1 = max(0, lit_cols[0] - 1), min(field_width, lit_cols[-1] + 2)
+        pixels = np.zeros((row1 - row0, col1 - col0, 4), dtype=np.uint8)
+        pixels[..., 1:3] = 255
+        pixels[..., 3] = np.where(lit[row0:row1, col0:col1], (355 - stacked[row0:row1, col0:col1]) / 255 * 128, 0)
+        water = pygame.image.frombuffer(pixels, (col1 - col0, row1 - row0), "RGBA").convert_alpha()
+        surface.blit(pygame.transform.smoothscale(water, ((col1 - col0) * scale, (row1 - row0) * scale)),
+                     (col0 * scale, row0 * scale))
+
+    def _stamp(self, rad: int, color: tuple[int, int, int]) -> pygame.Surface:
+        if color != self._stamp_color:
+            self._stamps.clear()
+            self._stamp_color = color
+        if rad not in self._stamps:
+            stamp = pygame.Surface((max(1, rad * 2), max(1, rad * 2)))
+            stamp.fill((0, 0, 0))
+            pygame.draw.circle(stamp, color, (rad, rad), rad)
+            self._stamps[rad] = stamp
+        return self._stamps[rad]
+
+    def draw_everything(self, surface: pygame.Surface, focus: tuple[float, float], zoom: float = 1.0,
+                        alpha: float = 1.0):
+        """
+        Draw on the screen, after the map: every particle adds its color to the pixels it covers.
+        All visible particles go to the surface in one blits() call, stamping a disc cached per radius.
+
+        :param focus: map position of the surface's top left corner
+        :param alpha: how far between the last two ticks to draw, like Game.draw_everything
+        """
+        if not len(self.pool):
+            return
+        if constants.GOOD_GRAPHICS:
+            return self._draw_good_graphics(surface, focus, zoom, alpha)
+        k = min(1, max(0, self.particles.__len__() / self.particle_budget - 1))
+        color = (int(25 * (1 - k)), int(5 + 20 * k), int(50 * k))
+        # color = (50 * k, 5 + 20 * (1 - k), 25 * (1 - k))
+        x, y, rad = self._screen_boxes(focus, zoom, alpha)
+        width, height = surface.get_size()
+        visible = (x + 2 * rad > 0) & (x < width) & (y + 2 * rad > 0) & (y < height) & (rad > 0)
+        surface.blits([(self._stamp(r, color), (left, top), None, pygame.BLEND_RGB_ADD)
+                       for left, top, r in zip(x[visible].tolist(), y[visible].tolist(), rad[visible].tolist())],
+                      doreturn=False)
+        # if self.orbited_particle:
+        #     pygame.draw.circle(surface, (255, 255, 255),
+        #                        (self.orbited_particle.x, self.orbited_particle.y), 10)
+
+    def _collide_everything(self):
+        pool = self.pool
+        n = len(pool)
+        if n < 2:
+            return
+        x, y, xv, yv = pool.x[:n], pool.y[:n], pool.xv[:n], pool.yv[:n]
+        rad, collide_rad, mass = pool.rad[:n], pool.collide_rad[:n], pool.mass[:n]
+        # neighbours are the pairs within adhesion reach, collisions only keep those that overlap
+        reach = max(water_particle_collider.ADHESION_DISTANCE + 2 * rad.max(), 2 * collide_rad.max())
+        i, j = neighbor_pairs(x, y, reach)
+        dx = x[j] - x[i]
+        dy = y[j] - y[i]
+        distance = np.hypot(dx, dy)
+        water_particle_collider.adhesive_particles(i, j, dx, dy, distance, rad, mass, xv, yv)
+        water_particle_collider.collide_particles(i, j, dx, dy, distance, collide_rad, mass, xv, yv)
+        water_particle_collider.repel_particles(i, j, dx, dy, distance, collide_rad, x, y, self.np_rng)
+
+    def _write_back(self):
+        """What WaterParticle.move does to dmg, then copy the arrays back to the particles"""
+        n = len(self.pool)
+        self.pool.dmg[:n] = np.hypot(self.pool.xv[:n], self.pool.yv[:n]) * constants.WATER_DMG_SCALE
+        self.pool.write_back(("x", "y", "prev_x", "prev_y", "xv", "yv", "lifespan", "dmg"))
+
+    def _spawn_at(self, x, y):
+        random_angle = self.rng.uniform(-math.pi, math.pi)
+        particle = WaterParticle.acquire(x, y, random_angle, radius=15, lifespan=self.rng.randint(10, 60))
+        self.pool.attach(particle)
+
+    def spawn_at(self, x, y):
+        if len(self.particles) > self.particle_budget:
+            return
+        self._spawn_at(x, y)
+
+    def _move(self):
+        if self.orbited_particle and self.orbited_particle.lifespan < 0:
+            self.orbited_particle = None
+        if self.orbited_particle:
+            power = self.orbited_particle.lifespan / 480
+            radius = power * 300 + 200
+            orbit_strength = 1
+            self._attract_to(self.orbited_particle.x, self.orbited_particle.y,
+                             radius, orbit_strength)
+            ACCELERATION = 1.0
+            if self.orbited_particle.speed < self.orbit_max_speed:
+                self.orbited_particle.speed += ACCELERATION
+            n = len(self.pool)
+            self.pool.x[:n] += self.orbited_particle.xv
+            self.pool.y[:n] += self.orbited_particle.yv
+            self.orbited_particle.move()
+        self.pool.step(write_back=False)
+
+    def _attract_to(self, x, y, radius, factor):
+        pool = self.pool
+        n = len(pool)
+        dx = x - pool.x[:n]
+        dy = y - pool.y[:n]
+        dis = np.hypot(dx, dy)
+        pulled = np.flatnonzero((dis <= radius) & (dis != 0))
+        if not pulled.size:
+            return
+        xv, yv = pool.xv[:n], pool.yv[:n]
+        if self.orbited_particle and self.orbit_acceleration:
+            # speed += orbit_acceleration, same direction
+            angle = np.arctan2(yv[pulled], xv[pulled])
+            speed = np.hypot(xv[pulled], yv[pulled]) + self.orbit_acceleration
+            xv[pulled] = speed * np.cos(angle)
+            yv[pulled] = speed * np.sin(angle)
+        xv[pulled] += dx[pulled] / dis[pulled] * factor
+        yv[pulled] += dy[pulled] / dis[pulled] * factor
+        pool.lifespan[pulled] = self.np_rng.integers(10, 30, pulled.size, endpoint=True)
+
+    def attract_to(self, x, y, radius=300, factor=1):
+        self.orbited_particle = None
+        self._attract_to(x, y, radius, factor)
+        self._write_back()
+
+    def _remove(self, dead: np.ndarray) -> int:
+        """
+        on_death() the particles in the dead slots, which detaches them, and release() them for _spawn_at().
+        A detach moves the last slot into the freed one, so going from the back leaves the dead slots still
+        to visit in place.
+        """
+        slots = np.flatnonzero(dead)
+        handles = self.pool.handles
+        for slot in reversed(slots.tolist()):
+            particle = handles[slot]
+            particle.on_death()
+            particle.release()
+        return slots.size
+
+    def _out_of(self, x_min, y_min, x_max, y_max) -> np.ndarray:
+        n = len(self.pool)
+        x, y = self.pool.x[:n], self.pool.y[:n]
+        return ~((x_min < x) & (x < x_max) & (y_min < y) & (y < y_max))
+
+    def _is_dead(self) -> np.ndarray:
+        """WaterParticle.is_dead() for every slot"""
+        n = len(self.pool)
+        return (self.pool.hp[:n] <= 0) | self.pool.culled[:n]
+
+    def remove_dead(self):
+        """Off the map, out of lifespan or dead, in one pass"""
+        self._remove(self._out_of(0, 0, constants.MAP_WIDTH, constants.MAP_HEIGHT)
+                     | (self.pool.lifespan[:len(self.pool)] <= 0) | self._is_dead())
+
+    def clear(self):
+        self.pool.clear()
+
+    def update(self):
+        self._move()
+        self._collide_everything()
+        self._write_back()
+        if not self.particles:
+            self.orbited_particle = None
+
+        if isinstance(self.orbited_particle, WaterParticle) and self.orbited_particle.speed == 0\
+                and self.orbit_acceleration and self.particles.__len__() < self.particle_budget * 2:
+            for _ in range(15):
+                self._spawn_at(self.orbited_particle.x, self.orbited_particle.y)
+
+    def release(self, mx, my, angle, speed, player):
+        n = len(self.pool)
+        if not n:
+            return
+        px = float(self.pool.x[:n].mean())
+        py = float(self.pool.y[:n].mean())
+        particle_mouse_dis = math.hypot(mx - px, my - py)
+        mouse_player_dis = math.hypot(player.x - mx, player.y - my)
+        pxv = float(self.pool.xv[:n].mean()) - player.xv
+        pyv = float(self.pool.yv[:n].mean()) - player.yv
+        particle_velocity = math.hypot(pxv, pyv)
+        speeds = np.hypot(self.pool.xv[:n], self.pool.yv[:n])
+        particle_speed = float(speeds.mean())
+        directed_constant = particle_mouse_dis + particle_velocity * 10 - n / 100
+        lifespan = 480
+        self.orbit_max_speed = min(particle_mouse_dis * 0.1, float(speeds.max()) * 2)
+        # if particle_speed > 5:
+        #     self.orbit_acceleration = particle_speed / 10
+        # else:
+        self.orbit_acceleration = 0.0
+        if directed_constant > 50.0:
+            particle_velocity = particle_mouse_dis * 0.005
+            angle = math.atan2(my - py, mx - px)
+        else:
+            particle_velocity = 0
+            self.orbit_max_speed = 0
+            if particle_speed > 5:
+                self.orbit_acceleration = particle_speed / 10
+        self.orbited_particle = WaterParticle(px, py, angle, particle_velocity, lifespan=lifespan)
+
+
+def main():
+    particles = [
+        WaterParticle(0, 0, 0, radius=30),  # --->
+        WaterParticle(50, 0, math.pi, radius=30),  # <---
+        WaterParticle(1000, 0, -math.pi / 2, radius=30),  # down
+        WaterParticle(1000, 50, math.pi / 2, radius=30)  # up
+    ]
+    handler = WaterParticleHandler(particles)
+    handler._collide_everything()
+    handler._write_back()
+
+    for p in particles:
+        print(f'Particle at ({p.x}, {p.y}) with velocity ({p.xv}, {p.yv})')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,37 +1,38 @@
-import random
-from typing import Any
-
-
-def is_tuple_of_two_numbers(val):
-    return isinstance(val, tuple) and len(val) == 2 and all(isinstance(i, (int, float)) for i in val)
-
-class BulletKwargsHandler:
-    def __init__(self, bullet_kwargs: dict[str, Any]):
-        self._original_kwargs: dict[str, Any] = bullet_kwargs
-        self._static_kwargs: dict[str, Any] = {}
-        self._random_kwargs: dict[str, Any] = {}
-        self._set_static_and_random_kwargs()
-
-    def _set_static_and_random_kwargs(self):
-        self._static_kwargs = {k: v for k, v in self._original_kwargs.items() if not is_tuple_of_two_numbers(v)}
-        self._random_kwargs = {k: v for k, v in self._original_kwargs.items() if is_tuple_of_two_numbers(v)}
-
-    def _get_generated_random_kwargs(self) -> dict[str, int | float]:
-        return {key: random.uniform(*val) for key, val in self._random_kwargs.items()}
-
-    def get_processed_kwargs(self) -> dict[str, Any]:
-        return {**self._static_kwargs, **self._get_generated_random_kwargs()}
-
-    def get_raw_kwargs(self):
-        return self._original_kwargs.copy()
-
-    def update_kwargs(self, **new_items: dict[str, Any]):
-        self._original_kwargs.update(new_items)
-        self._set_static_and_random_kwargs()
-
-    def getattr(self, name: str, default: Any = None) -> Any:
-        return self._original_kwargs.get(name, default)
-
-    def __str__(self):
-        return str(self.get_processed_kwargs())
-
+import random
+from typing import Any
+
+
+def is_tuple_of_two_numbers(val):
+    return isinstance(val, tuple) and len(val) == 2 and all(isinstance(i, (int, float)) for i in val)
+
+class BulletKwargsHandler:
+    def __init__(self, bullet_kwargs: dict[str, Any]):
+        self._original_kwargs: dict[str, Any] = bullet_kwargs
+        self._static_kwargs: dict[str, Any] = {}
+        self._random_kwargs: dict[str, Any] = {}
+        self._set_static_and_random_kwargs()
+
+    def _set_static_and_random_kwargs(self):
+        self._static_kwargs = {k: v for k, v in self._original_kwargs.items() if not is_tuple_of_two_numbers(v)}
+        self._random_kwargs = {k: v for k, v in self._original_kwargs.items() if is_tuple_of_two_numbers(v)}
+
+    def _get_generated_random_kwargs(self, rng: random.Random) -> dict[str, int | float]:
+        return {key: rng.uniform(*val) for key, val in self._random_kwargs.items()}
+
+    def get_processed_kwargs(self, rng: random.Random = random) -> dict[str, Any]:
+        """:param rng: draws the random ranges, pass the game's rng for anything that ends up in the simulation"""
+        return {**self._static_kwargs, **self._get_generated_random_kwargs(rng)}
+
+    def get_raw_kwargs(self):
+        return self._original_kwargs.copy()
+
+    def updated(self, **new_items: dict[str, Any]) -> 'BulletKwargsHandler':
+        """:return: a new handler with new_items over these kwargs, this one is left as it is"""
+        return BulletKwargsHandler({**self._original_kwargs, **new_items})
+
+    def getattr(self, name: str, default: Any = None) -> Any:
+        return self._original_kwargs.get(name, default)
+
+    def __str__(self):
+        return str(self.get_processed_kwargs())
+
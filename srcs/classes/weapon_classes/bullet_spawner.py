@@ -1,56 +1,101 @@
-from __future__ import annotations
-import math
-from srcs.classes.entity.base_unit import BaseUnit
-from srcs.classes.entity.bullet import Bullet
-from srcs.classes.entity.faction_particle import FactionParticle
-from srcs.classes.entity.game_particle import GameParticle
-from srcs.classes.weapon_classes.bullet_kwargs_handler import BulletKwargsHandler
-
-
-class BulletSpawner:
-    def __init__(self,
-                 bullet_kwargs: BulletKwargsHandler,
-                 bullet_class: type[FactionParticle] = Bullet,
-                 spread: float = math.pi * 0.8,
-                 spawn_radius: float = 0,
-                 offset_factor: float = 1.0,
-                 angle_offset: float = 0.0):
-        self.bullet_kwargs: BulletKwargsHandler = bullet_kwargs
-        self.bullet_class: type[FactionParticle] = bullet_class
-        self.spread: float = spread
-        self.spawn_radius: float = spawn_radius
-        self.offset_factor: float = offset_factor
-        self.angle_offset: float = angle_offset
-
-    def get_sample(self):
-        return self.bullet_class(None, 0, 0, 0,
-                                 **self.bullet_kwargs.get_processed_kwargs())
-
-    def spawn_bullet(self, x, y, angle, parent: BaseUnit) -> GameParticle:
-        bullet = self.bullet_class(
-            parent.faction,
-            **self.bullet_kwargs.get_processed_kwargs(),
-            parent=parent
-        )
-        bullet.x = x
-        bullet.y = y
-        bullet.angle = angle
-        return bullet
-
-    def circular_spawn(self, x, y, angle: float, count: int, parent: BaseUnit) -> list:
-        if count == 0:
-            return []
-        angle_offset = self.spread / count
-        spawned_bullets = []
-
-        for i in range(count):
-            offset = (i - (count - 1) / 2) * angle_offset
-            shoot_angle = angle + self.angle_offset + offset
-            bullet_angle = angle + self.angle_offset + offset * self.offset_factor
-            dy, dx = math.sin(shoot_angle) * self.spawn_radius, math.cos(shoot_angle) * self.spawn_radius
-
-            spawned_bullets.append(
-                self.spawn_bullet(x + dx, y + dy, bullet_angle, parent)
-            )
-
+from __future__ import annotations
+import math
+from collections.abc import Callable, Hashable
+from typing import Any
+from srcs.classes.entity.base_unit import BaseUnit
+from srcs.classes.entity.bullet import Bullet
+from srcs.classes.entity.faction_particle import FactionParticle
+from srcs.classes.entity.game_particle import GameParticle
+from srcs.classes.entity.recyclable import Recyclable
+from srcs.classes.weapon_classes.bullet_kwargs_handler import BulletKwargsHandler
+
+
+_MISSING = object()
+
+
+class BulletSpawner:
+    """
+    Shared by every copy of a weapon, so it never changes once made: the with_*() methods return
+    a spawner with the change instead, and remember it so every unit making the same change (tinting
+    its bullets to its faction's color) shares it too.
+    """
+
+    def __init__(self,
+                 bullet_kwargs: BulletKwargsHandler,
+                 bullet_class: type[FactionParticle] = Bullet,
+                 spread: float = math.pi * 0.8,
+                 spawn_radius: float = 0,
+                 offset_factor: float = 1.0,
+                 angle_offset: float = 0.0):
+        self.bullet_kwargs: BulletKwargsHandler = bullet_kwargs
+        self.bullet_class: type[FactionParticle] = bullet_class
+        self.spread: float = spread
+        self.spawn_radius: float = spawn_radius
+        self.offset_factor: float = offset_factor
+        self.angle_offset: float = angle_offset
+        self._derived: dict[Hashable, BulletSpawner] = {}
+
+    def _derive(self, key: Hashable, make: Callable[[], BulletSpawner]) -> BulletSpawner:
+        try:
+            spawner = self._derived.get(key)
+        except TypeError:
+            # unhashable kwargs aren't remembered
+            return make()
+        if spawner is None:
+            spawner = self._derived[key] = make()
+        return spawner
+
+    def _replace(self, bullet_kwargs: BulletKwargsHandler, bullet_class: type[FactionParticle]) -> BulletSpawner:
+        return BulletSpawner(bullet_kwargs, bullet_class=bullet_class, spread=self.spread,
+                             spawn_radius=self.spawn_radius, offset_factor=self.offset_factor,
+                             angle_offset=self.angle_offset)
+
+    def with_bullet_kwargs(self, **new_items: Any) -> BulletSpawner:
+        if all(self.bullet_kwargs.getattr(k, _MISSING) == v for k, v in new_items.items()):
+            return self
+        return self._derive(tuple(new_items.items()),
+                            lambda: self._replace(self.bullet_kwargs.updated(**new_items), self.bullet_class))
+
+    def with_bullet_class(self, bullet_class: type[FactionParticle]) -> BulletSpawner:
+        if bullet_class is self.bullet_class:
+            return self
+        return self._derive(bullet_class, lambda: self._replace(self.bullet_kwargs, bullet_class))
+
+    def get_sample(self):
+        return self.bullet_class(None, 0, 0, 0,
+                                 **self.bullet_kwargs.get_processed_kwargs())
+
+    def spawn_bullet(self, x, y, angle, parent: BaseUnit) -> GameParticle:
+        # units can be spawned too, only projectiles are reused
+        create = self.bullet_class.acquire if issubclass(self.bullet_class, Recyclable) else self.bullet_class
+        bullet = create(
+            parent.faction,
+            **self.bullet_kwargs.get_processed_kwargs(parent.faction.game_data.rng),
+            parent=parent
+        )
+        bullet.x = x
+        bullet.y = y
+        bullet.angle = angle
+        return bullet
+
+    def circular_spawn(self, x, y, angle: float, count: int, parent: BaseUnit,
+                       spawn_radius: float | None = None, angle_offset: float | None = None) -> list:
+        """:param spawn_radius, angle_offset: for this spawn only, instead of the spawner's own"""
+        if count == 0:
+            return []
+        spawn_radius = self.spawn_radius if spawn_radius is None else spawn_radius
+        angle_offset = self.angle_offset if angle_offset is None else angle_offset
+        step = self.spread / count
+        spawned_bullets = []
+
+        for i in range(count):
+            offset = (i - (count - 1) / 2) * step
+            shoot_angle = angle + angle_offset + offset
+            bullet_angle = angle + angle_offset + offset * self.offset_factor
+            dy, dx = math.sin(shoot_angle) * spawn_radius, math.cos(shoot_angle) * spawn_radius
+
+            spawned_bullets.append(
+                self.spawn_bullet(x + dx, y + dy, bullet_angle, parent)
+            )
+
         return spawned_bullets
\ No newline at end of file
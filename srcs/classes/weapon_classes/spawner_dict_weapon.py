@@ -1,32 +1,47 @@
-import random
-from typing import override
-
-from srcs.classes.controller import SmartAIController, BaseController, AIController
-from srcs.classes.entity.base_unit import BaseUnit
-from srcs.classes.entity.game_particle import GameParticle
-from srcs.classes.weapon_classes.random_spawner_weapon import RandomSpawnerWeapon
-
-
-class SpawnerDictWeapon(RandomSpawnerWeapon):
-    def __init__(self, name: str, unit_dict: dict[type[BaseUnit], int]=None,
-                 *args, **kwargs):
-        super().__init__(name, *args, **kwargs)
-        # directly editing unit_dict will work
-        self.unit_dict: dict[type[BaseUnit], int] = unit_dict if unit_dict is not None else {}
-
-    @override
-    def _shoot(self, unit: BaseUnit, target_x: float, target_y: float, **kwargs) -> list[GameParticle]:
-        items = list(self.unit_dict.items())
-        # items.reverse()
-        random.shuffle(items)
-        for unit_type, cap in items:
-            count = sum(isinstance(i, unit_type) for i in unit.faction.parent_list)
-            if count >= cap:
-                continue
-            sample = unit_type(unit.faction, -100000, -100000)
-            sample.kill()
-            if sample.base_score > unit.score:
-                continue
-            self.change_bullet_class(unit_type)
-            return super()._shoot(unit, target_x, target_y)
-        return []
\ No newline at end of file
+from typing import override
+
+from srcs.classes.controller import SmartAIController, BaseController, AIController
+from srcs.classes.entity.base_unit import BaseUnit
+from srcs.classes.entity.game_particle import GameParticle
+from srcs.classes.weapon_classes.random_spawner_weapon import RandomSpawnerWeapon
+
+
+class SpawnerDictWeapon(RandomSpawnerWeapon):
+    # base_score of each unit type, read off a sample the first time it's needed
+    _base_scores: dict[type[BaseUnit], int] = {}
+
+    def __init__(self, name: str, unit_dict: dict[type[BaseUnit], int]=None,
+                 *args, **kwargs):
+        super().__init__(name, *args, **kwargs)
+        # directly editing unit_dict will work
+        self.unit_dict: dict[type[BaseUnit], int] = unit_dict if unit_dict is not None else {}
+
+    @override
+    def copy(self):
+        weapon = super().copy()
+        # each unit edits its own
+        weapon.unit_dict = dict(self.unit_dict)
+        return weapon
+
+    @override
+    def _shoot(self, unit: BaseUnit, target_x: float, target_y: float, **kwargs) -> list[GameParticle]:
+        items = list(self.unit_dict.items())
+        # items.reverse()
+        unit.faction.game_data.rng.shuffle(items)
+        for unit_type, cap in items:
+            count = sum(isinstance(i, unit_type) for i in unit.faction.parent_list)
+            if count >= cap:
+                continue
+            if self._get_base_score(unit_type, unit) > unit.score:
+                continue
+            self.change_bullet_class(unit_type)
+            return super()._shoot(unit, target_x, target_y)
+        return []
+
+    def _get_base_score(self, unit_type: type[BaseUnit], unit: BaseUnit) -> int:
+        base_score = self._base_scores.get(unit_type)
+        if base_score is None:
+            sample = unit_type(unit.faction, -100000, -100000)
+            sample.kill()
+            base_score = self._base_scores[unit_type] = sample.base_score
+        return base_score
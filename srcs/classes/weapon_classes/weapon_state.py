@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from srcs.classes.weapon_classes.level_handler import LevelHandler
+from srcs.classes.weapon_classes.reload_counter import CooldownTimer
+
+
+class WeaponState:
+    """
+    What each unit's copy of a weapon keeps to itself: its level, reload and overdrive.
+    The rest of the weapon (bullet kwargs, spawner) is shared between the copies, see BaseWeapon.copy().
+    """
+    __slots__ = ("level", "shoot_cd", "overdrive_cd", "overdrive_active", "overdrive_is_active")
+
+    def __init__(self, level: LevelHandler, shoot_cd: CooldownTimer, overdrive_cd: CooldownTimer,
+                 overdrive_active: CooldownTimer, overdrive_is_active: bool = False):
+        self.level: LevelHandler = level
+        self.shoot_cd: CooldownTimer = shoot_cd
+        self.overdrive_cd: CooldownTimer = overdrive_cd
+        self.overdrive_active: CooldownTimer = overdrive_active
+        self.overdrive_is_active: bool = overdrive_is_active
+
+    def copy(self) -> WeaponState:
+        return WeaponState(self.level.copy(), self.shoot_cd.copy(), self.overdrive_cd.copy(),
+                           self.overdrive_active.copy(), self.overdrive_is_active)
@@ -1,38 +1,49 @@
-# Constants
-SCREEN_WIDTH = 1520
-SCREEN_HEIGHT = 800
-MAP_WIDTH = 8000
-MAP_HEIGHT = 8000
-PLAYER_RADIUS = 5
-BULLET_RADIUS = 2
-MISSILE_RADIUS = 7
-UNIT_RADIUS = 10
-COLLECTIBLE_RADIUS = 15
-
-# color
-PLAYER_COLOR = (255, 255, 0)  # Yellow
-BULLET_COLOR = (255, 255, 255)  # White
-MISSILE_COLOR = (0, 255, 0)  # Green
-ENEMY_COLOR = (255, 102, 204)  # Pink
-ENEMY_BULLET_COLOR = (255, 100, 255)
-BACKGROUND_COLOR = (0, 0, 0)  # Black
-EXPLOSION_COLOR = (255, 105, 0)
-FLAME_COLOR = (255, 55, 0)
-
-UNIT_SCORE = 10
-UNIT_SHOOT_RANGE = min(SCREEN_WIDTH, SCREEN_HEIGHT) / 2 - 100
-UNIT_BULLET_RAD = 4
-MAX_ENEMY_COUNT = 250
-PLAYER_HP = 50
-HEAL_HP = 5
-PLAYER_SPEED = 20
-BULLET_SPEED = 15.0
-MISSILE_SPEED = BULLET_SPEED
-UNIT_SPEED = 2
-MAX_PARTICLE_COUNT = 200
-OVERDRIVE_DURATION = 5000.0  # miliseconds
-OVERDRIVE_CD = 65000.0
-GOOD_GRAPHICS = False
-FPS = 30
-SPAWN_CAP = 200
+# Constants
+SCREEN_WIDTH = 1520
+SCREEN_HEIGHT = 800
+MAP_WIDTH = 8000
+MAP_HEIGHT = 8000
+PLAYER_RADIUS = 5
+BULLET_RADIUS = 2
+MISSILE_RADIUS = 7
+UNIT_RADIUS = 10
+COLLECTIBLE_RADIUS = 15
+
+# color
+PLAYER_COLOR = (255, 255, 0)  # Yellow
+BULLET_COLOR = (255, 255, 255)  # White
+MISSILE_COLOR = (0, 255, 0)  # Green
+ENEMY_COLOR = (255, 102, 204)  # Pink
+ENEMY_BULLET_COLOR = (255, 100, 255)
+BACKGROUND_COLOR = (0, 0, 0)  # Black
+EXPLOSION_COLOR = (255, 105, 0)
+FLAME_COLOR = (255, 55, 0)
+
+UNIT_SCORE = 10
+UNIT_SHOOT_RANGE = min(SCREEN_WIDTH, SCREEN_HEIGHT) / 2 - 100
+UNIT_BULLET_RAD = 4
+MAX_ENEMY_COUNT = 250
+PLAYER_HP = 50
+HEAL_HP = 5
+PLAYER_SPEED = 20
+BULLET_SPEED = 15.0
+MISSILE_SPEED = BULLET_SPEED
+UNIT_SPEED = 2
+MAX_PARTICLE_COUNT = 200
+WATER_DMG_SCALE = 25 / 200  # water damage per unit of speed
+RECYCLE_LIMIT = 2000  # dead particles kept per class for Recyclable.acquire() to reuse
+MAX_DEBRIS_COUNT = 1000  # pieces of broken units on the map at once
+COLLISION_CELL_SIZE = 64
+SEPARATION_ITERATIONS = 2  # passes over the overlapping units of a side per tick, see separate_pairs()
+OVERDRIVE_DURATION = 5000.0  # miliseconds
+OVERDRIVE_CD = 65000.0
+GOOD_GRAPHICS = True
+WATER_FIELD_DOWNSCALE = 4  # GOOD_GRAPHICS water is computed at 1 / this of the screen's resolution
+SPRITE_CACHE_SIZE = 512  # circle sprites kept by SpriteCache
+SPRITE_ALPHA_STEP = 8
+TEXT_CACHE_SIZE = 256  # rendered lines kept by TextCache
+FPS = 30  # simulation ticks per second
+RENDER_FPS = 60  # frames drawn per second at most, 0 for uncapped
+MAX_CATCH_UP_TICKS = 5  # ticks run before a frame is drawn when rendering falls behind
+SPAWN_CAP = 200
 SPAWN_CD = 4  # seconds
\ No newline at end of file
@@ -1,3 +1,3 @@
-import pygame
-
-print(pygame.font.get_fonts())
+import pygame
+
+print(pygame.font.get_fonts())
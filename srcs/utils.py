@@ -1,69 +1,101 @@
-import math
-
-def sigmoid(x: float, q: float) -> float:
-    """
-
-    :param float x: the variable
-    :param float q: value where f(x) reaches 0.9
-    :return float: [0.0, 1.0)
-    """
-    k = 4 / q
-    # got value through desmos by
-    # using x=q
-    # using k=\frac{4}{q}
-    # using \left(\frac{2}{\pi}\right)\arctan(\left(\frac{\pi}{2}\right)kx)
-    result = (2 / math.pi) * math.atan((math.pi / 2) * k * x)
-    return result
-
-
-def clamp(value, min_val, max_val):
-    if min_val > max_val:
-        min_val, max_val = max_val, min_val
-    return min(max(value, min_val), max_val)
-
-def angle_norm(angle):
-    return (angle + math.pi) % (2 * math.pi) - math.pi
-
-def angle_add(angle, add):
-    return angle_norm(angle + add)
-
-def angle_diff(dst, src):
-    return angle_norm(dst - src)
-
-
-def color_norm(color):
-    return tuple(min(max(i, 0), 255) for i in color)
-
-
-def color_intensity_shift(color: tuple, intensity: float):
-    """
-    :param color: (R, G, B)
-    :param intensity: 0.0 ~ 1.0
-    :return: (R, G, B) with adjusted intensity
-    """
-    intensity = min(1.0, max(0.0, intensity))
-    return tuple(int(c * intensity) for c in color)
-
-
-def color_mix(color1, color2, weight1=1.0, weight2=1.0):
-    """
-    :param color1: (R, G, B)
-    :param color2: (R, G, B)
-    :param weight1: float
-    :param weight2: float
-    :return: (R, G, B)
-    """
-    # Normalize weights
-    total_weight = weight1 + weight2
-    weight1 /= total_weight
-    weight2 /= total_weight
-
-    # Mix colors
-    mixed_color = (
-        int(color1[0] * weight1 + color2[0] * weight2),
-        int(color1[1] * weight1 + color2[1] * weight2),
-        int(color1[2] * weight1 + color2[2] * weight2)
-    )
-
-    # Normalize the mixed color
-    return color_norm(mixed_color)
+import math
+
+def sigmoid(x: float, q: float) -> float:
+    """
+
+    :param float x: the variable
+    :param float q: value where f(x) reaches 0.9
+    :return float: [0.0, 1.0)
+    """
+    k = 4 / q
+    # got value through desmos by
+    # using x=q
+    # using k=\frac{4}{q}
+    # using \left(\frac{2}{\pi}\right)\arctan(\left(\frac{\pi}{2}\right)kx)
+    result = (2 / math.pi) * math.atan((math.pi / 2) * k * x)
+    return result
+
+
+def clamp(value, min_val, max_val):
+    if min_val > max_val:
+        min_val, max_val = max_val, min_val
+    return min(max(value, min_val), max_val)
+
+def angle_norm(angle):
+    return (angle + math.pi) % (2 * math.pi) - math.pi
+
+def angle_add(angle, add):
+    return angle_norm(angle + add)
+
+def angle_diff(dst, src):
+    return angle_norm(dst - src)
+
+
+def color_norm(color):
+    return tuple(min(max(i, 0), 255) for i in color)
+
+
+def color_intensity_shift(color: tuple, intensity: float):
+    """
+    :param color: (R, G, B)
+    :param intensity: 0.0 ~ 1.0
+    :return: (R, G, B) with adjusted intensity
+    """
+    intensity = min(1.0, max(0.0, intensity))
+    return tuple(int(c * intensity) for c in color)
+
+
+def color_mix(color1, color2, weight1=1.0, weight2=1.0):
+    """
+    :param color1: (R, G, B)
+    :param color2: (R, G, B)
+    :param weight1: float
+    :param weight2: float
+    :return: (R, G, B)
+    """
+    # Normalize weights
+    total_weight = weight1 + weight2
+    weight1 /= total_weight
+    weight2 /= total_weight
+
+    # Mix colors
+    mixed_color = (
+        int(color1[0] * weight1 + color2[0] * weight2),
+        int(color1[1] * weight1 + color2[1] * weight2),
+        int(color1[2] * weight1 + color2[2] * weight2)
+    )
+
+    # Normalize the mixed color
+    return color_norm(mixed_color)
+
+
+def remove_dead(particles: list, is_dead=None, on_removed=None, added: list | None = None) -> int:
+    """
+    Remove dead particles in place in a single pass, calling on_death() once for each.
+    Swap-removes, so the list order is not kept. on_death() may append to the same list,
+    the appended particles are checked as well.
+
+    :param particles: list of GameParticle
+    :param is_dead: predicate to use instead of particle.is_dead()
+    :param on_removed: called with each particle once it is out of the list
+    :param added: collects what on_death() appended to the list
+    :return: number of particles removed
+    """
+    removed = 0
+    i = 0
+    while i < len(particles):
+        particle = particles[i]
+        if not (particle.is_dead() if is_dead is None else is_dead(particle)):
+            i += 1
+            continue
+        count = len(particles)
+        particle.on_death()
+        if added is not None:
+            added.extend(particles[count:])
+        last = particles.pop()
+        if i < len(particles):
+            particles[i] = last
+        if on_removed is not None:
+            on_removed(particle)
+        removed += 1
+    return removed
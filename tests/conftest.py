@@ -0,0 +1,20 @@
+import os
+import sys
+
+# no window, no sound card: the game runs on SDL's dummy drivers
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from srcs.main import Game
+
+
+@pytest.fixture
+def game() -> Game:
+    """A seeded headless game with nothing but the player on the map"""
+    game = Game(headless=True, seed=0)
+    game.data.enemies[:] = []
+    game.data.allies[:] = [game.data.player]
+    return game
@@ -0,0 +1,26 @@
+import numpy as np
+
+from srcs.classes.bullet_enemy_collider import collide_pairs
+from srcs.classes.collision_layers import layer_of
+from srcs.classes.damage_buffer import DamageBuffer
+from srcs.classes.entity.bullet import Bullet
+from srcs.classes.entity.unit import Unit
+
+
+def test_bullet_is_used_up_by_its_nearest_target(game):
+    bullet = Bullet(game.ally_faction, 1000, 1000, hp=1, dmg=1)
+    far = Unit(game.enemy_faction, 1000, 1008, hp=5)
+    near = Unit(game.enemy_faction, 1005, 1000, hp=5)
+    particles = [bullet, far, near]
+    layers = np.array([layer_of(p) for p in particles])
+    x = np.array([p.x for p in particles], dtype=float)
+    y = np.array([p.y for p in particles], dtype=float)
+    rad = np.array([p.rad for p in particles], dtype=float)
+
+    damage = DamageBuffer()
+    collide_pairs(particles, np.array([0, 0]), np.array([1, 2]), layers, x, y, rad, damage)
+    damage.resolve()
+
+    assert bullet.hp <= 0
+    assert near.hp == 4
+    assert far.hp == 5
@@ -0,0 +1,16 @@
+import math
+
+from srcs.classes.entity.lazer import Lazer
+
+
+def test_pooled_lazer_end_follows_its_head(game):
+    lazer = Lazer(game.ally_faction, 1000, 1000, angle=0.5, speed=9, radius=5, hp=20)
+    game.data.allies.append(lazer)
+    # the first move attaches it to the projectile pool, the second is the pool's step
+    game.move_everything()
+    assert lazer.is_pooled()
+    game.move_everything()
+
+    assert lazer.x != lazer.prev_x
+    assert math.isclose(lazer.end_x, lazer.x + math.cos(lazer.angle) * lazer.length)
+    assert math.isclose(lazer.end_y, lazer.y + math.sin(lazer.angle) * lazer.length)
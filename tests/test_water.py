@@ -0,0 +1,29 @@
+import random
+
+from srcs.classes.water_particle_handler import WaterParticleHandler
+
+
+def test_particles_apart_attract_each_other():
+    handler = WaterParticleHandler(rng=random.Random(0))
+    handler._spawn_at(1000, 1000)
+    handler._spawn_at(1020, 1000)
+    n = len(handler.pool)
+    handler.pool.xv[:n] = 0
+    handler.pool.yv[:n] = 0
+    handler._collide_everything()
+
+    left, right = handler.pool.xv[:n]
+    assert left > 0
+    assert right < 0
+
+
+def test_damage_does_not_follow_the_particle_budget():
+    damages = []
+    for budget in (200, 2000):
+        handler = WaterParticleHandler(rng=random.Random(0))
+        handler.particle_budget = budget
+        handler._spawn_at(1000, 1000)
+        handler.pool.xv[0], handler.pool.yv[0] = 3, 4
+        handler._write_back()
+        damages.append(handler.particles[0].dmg)
+    assert damages[0] == damages[1] == 5 * 25 / 200
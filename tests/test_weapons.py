@@ -0,0 +1,10 @@
+from srcs.classes.entity.unit import Unit
+from srcs.classes.weapon_classes.spawner_dict_weapon import SpawnerDictWeapon
+
+
+def test_spawner_dict_copies_do_not_share_unit_dict():
+    weapon = SpawnerDictWeapon("spawner", {Unit: 5})
+    copy = weapon.copy()
+    copy.unit_dict[Unit] = 0
+
+    assert weapon.unit_dict == {Unit: 5}